@@ -4,7 +4,7 @@ ContextFlow Module Entry Point
 Allows running ContextFlow as a module: python -m contextflow
 """
 
-from contextflow.cli import main
+from contextflow.cli import entry
 
 if __name__ == "__main__":
-    main()
+    entry()
@@ -12,10 +12,16 @@ __author__ = "Matt Wheeler"
 __email__ = "matt.wheeler70@gmail.com"
 __license__ = "MIT"
 
-from .core.session_updater import SessionUpdater
-from .core.context_extractor import ContextExtractor
-from .core.workflow_manager import WorkflowManager
-from .core.config import ContextFlowConfig
+import importlib
+
+# Public classes are imported on first access so that `import contextflow`
+# (and therefore the CLI) does not pull in requests and the integrations
+_LAZY_EXPORTS = {
+    "SessionUpdater": ".core.session_updater",
+    "ContextExtractor": ".core.context_extractor",
+    "WorkflowManager": ".core.workflow_manager",
+    "ContextFlowConfig": ".core.config",
+}
 
 __all__ = [
     "SessionUpdater",
@@ -23,3 +29,16 @@ __all__ = [
     "WorkflowManager",
     "ContextFlowConfig",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,9 @@
+"""
+ContextFlow Module Entry Point
+Allows running ContextFlow as a module: python -m contextflow
+"""
+
+from contextflow.cli import entry
+
+if __name__ == "__main__":
+    entry()
@@ -3,18 +3,45 @@ ContextFlow Command Line Interface
 """
 
 import click
+import heapq
+import os
+import re
+import shutil
 import sys
+import time
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 
-from contextflow.core.config import ContextFlowConfig
-from .core.session_updater import SessionUpdater
-from .core.context_extractor import ContextExtractor
-from .templates.project_templates import ProjectTemplates
+from contextflow.core.config import SUPPORTED_INTEGRATIONS, ContextFlowConfig
 
-console = Console()
+# rich, the integrations and the context/session machinery are imported inside
+# the commands that use them so that `--help` and light commands start quickly
+
+VALID_INTEGRATIONS = frozenset(SUPPORTED_INTEGRATIONS)
+
+# Status labels shared by the status panels and tables
+YES, NO = "✅ Yes", "❌ No"
+ENABLED, DISABLED = "✅ Enabled", "❌ Disabled"
+REQUIRED, OPTIONAL = "✅ Required", "❌ Optional"
+
+SESSION_SUMMARY_PATTERN = re.compile(r"## Session Summary\n\n(.*?)\n\n", re.DOTALL)
+
+# The summary sits right below the log header, so the head of the file is enough
+LOG_SUMMARY_READ_SIZE = 4096
+
+# `context --quick` is typically bound to an editor key and run many times a
+# day, so entry() answers it directly instead of dispatching the Click group
+QUICK_CONTEXT_ARGS = (["context", "--quick"], ["context", "-q"])
+RAW_QUICK_CONTEXT_ARGS = (["context", "--raw"], ["context", "--quick", "--raw"])
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Get the shared rich console, created on first use"""
+    from rich.console import Console
+
+    return Console()
 
 
 @click.group()
@@ -36,6 +63,11 @@ def main():
 )
 def init(template, name, description):
     """Initialize a new ContextFlow project"""
+    from .core.context_extractor import ContextExtractor
+    from .templates.project_templates import ProjectTemplates
+
+    console = _console()
+
     try:
         console.print(f"Initializing ContextFlow project: [bold]{name}[/bold]")
 
@@ -64,11 +96,73 @@ def init(template, name, description):
         sys.exit(1)
 
 
+def _copy_file_to_stdout(path: Path):
+    """Copy a file to stdout byte for byte, with sendfile where the platform allows it"""
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.flush()
+
+    with open(path, "rb") as src:
+        offset = 0
+        try:
+            out_fd = out.fileno()
+            size = os.fstat(src.fileno()).st_size
+            while offset < size:
+                sent = os.sendfile(out_fd, src.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+            return
+        except (AttributeError, OSError, ValueError):
+            # No real stdout descriptor (e.g. captured output) or no sendfile support
+            src.seek(offset)
+            shutil.copyfileobj(src, out)
+            out.flush()
+
+
+def show_quick_context(config: ContextFlowConfig, raw: bool = False):
+    """Print the quick AI context file in a copy-paste ready panel, or as-is when raw"""
+    from rich.panel import Panel
+
+    console = _console()
+    quick_file = config.get_context_directory() / config.ai_context.quick_context_file
+
+    if raw and quick_file.exists():
+        _copy_file_to_stdout(quick_file)
+    elif quick_file.exists():
+        console.print(
+            Panel.fit(
+                quick_file.read_text(encoding="utf-8"),
+                title="Quick AI Context",
+                border_style="green",
+            )
+        )
+        console.print("\nCopy the above content and paste into your new AI session")
+    else:
+        console.print("Quick context file not found. Run: contextflow context --refresh")
+
+
+def run_quick_context(raw: bool = False):
+    """Run `contextflow context --quick` without going through Click's command dispatch"""
+    try:
+        show_quick_context(ContextFlowConfig(), raw=raw)
+    except Exception as e:
+        _console().print(f"Error getting context: {e}")
+        sys.exit(1)
+
+
 @main.command()
 @click.option("--quick", "-q", is_flag=True, help="Show quick context for immediate use")
 @click.option("--refresh", "-r", is_flag=True, help="Refresh context from latest project state")
-def context(quick, refresh):
+@click.option(
+    "--raw", is_flag=True, help="Print the quick context file as-is, for piping (implies --quick)"
+)
+def context(quick, refresh, raw):
     """Get AI context for new sessions"""
+    from .core.context_extractor import ContextExtractor
+
+    console = _console()
+
     try:
         config = ContextFlowConfig()
 
@@ -77,23 +171,10 @@ def context(quick, refresh):
             extractor = ContextExtractor(config)
             extractor.extract_and_generate_context()
 
-        context_dir = config.get_context_directory()
-
-        if quick:
-            quick_file = context_dir / config.ai_context.quick_context_file
-            if quick_file.exists():
-                console.print(
-                    Panel.fit(
-                        quick_file.read_text(encoding="utf-8"),
-                        title="Quick AI Context",
-                        border_style="green",
-                    )
-                )
-                console.print("\nCopy the above content and paste into your new AI session")
-            else:
-                console.print("Quick context file not found. Run: contextflow context --refresh")
+        if quick or raw:
+            show_quick_context(config, raw=raw)
         else:
-            full_file = context_dir / config.ai_context.full_context_file
+            full_file = config.get_context_directory() / config.ai_context.full_context_file
             if full_file.exists():
                 console.print(f"Full context available at: [bold]{full_file}[/bold]")
                 console.print("Use --quick flag for copy-paste ready context")
@@ -109,6 +190,10 @@ def context(quick, refresh):
 @click.argument("summary", required=True)
 def update(summary):
     """Update session documentation"""
+    from .core.session_updater import SessionUpdater
+
+    console = _console()
+
     try:
         config = ContextFlowConfig()
 
@@ -142,6 +227,10 @@ def update(summary):
 @click.option("--count", "-c", default=10, help="Number of logs to show")
 def logs(recent, count):
     """View session logs"""
+    from rich.table import Table
+
+    console = _console()
+
     try:
         config = ContextFlowConfig()
         log_dir = config.get_session_log_directory()
@@ -150,47 +239,56 @@ def logs(recent, count):
             console.print("📝 No session logs found")
             return
 
-        log_files = list(log_dir.glob("session_*.md"))
+        # One directory read; DirEntry carries the stat data we need
+        with os.scandir(log_dir) as it:
+            log_files = [
+                (entry.stat().st_mtime, entry.name, entry.path)
+                for entry in it
+                if entry.name.startswith("session_") and entry.name.endswith(".md")
+            ]
 
         if not log_files:
             console.print("📝 No session logs found")
             return
 
-        # Sort by modification time (newest first)
-        log_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
         if recent:
             # Filter to recent logs (last 7 days)
-            import time
-
             cutoff_time = time.time() - (7 * 24 * 60 * 60)
-            log_files = [f for f in log_files if f.stat().st_mtime > cutoff_time]
+            log_files = [f for f in log_files if f[0] > cutoff_time]
 
-        # Limit count
-        log_files = log_files[:count]
+        # Keep the newest `count` logs by modification time, newest first
+        log_files = heapq.nlargest(count, log_files)
 
         table = Table(title="📝 Session Logs")
         table.add_column("Date", style="cyan")
         table.add_column("Summary", style="white")
 
-        for log_file in log_files:
+        for _, log_name, log_path in log_files:
             try:
-                # Extract date from filename
-                date_str = log_file.stem.replace("session_", "")
-                date_formatted = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]} {date_str[9:11]}:{date_str[11:13]}"
-
-                # Extract summary from file
-                content = log_file.read_text(encoding="utf-8")
-                import re
+                # Extract date from filename (session_YYYYMMDD_HHMMSS.md)
+                date_formatted = datetime.strptime(log_name[8:-3], "%Y%m%d_%H%M%S").strftime(
+                    "%Y-%m-%d %H:%M"
+                )
+            except ValueError:
+                # Other session_*.md names still get their summary shown
+                date_formatted = log_name
 
-                summary_match = re.search(r"## Session Summary\n\n(.*?)\n\n", content, re.DOTALL)
+            try:
+                # Extract summary from the head of the file
+                with open(log_path, "r", encoding="utf-8") as f:
+                    content = f.read(LOG_SUMMARY_READ_SIZE)
+                    summary_match = SESSION_SUMMARY_PATTERN.search(content)
+                    if not summary_match:
+                        # Summary longer than the head, fall back to the whole file
+                        content += f.read()
+                        summary_match = SESSION_SUMMARY_PATTERN.search(content)
                 summary = (
                     summary_match.group(1).strip()[:80] + "..." if summary_match else "No summary"
                 )
 
                 table.add_row(date_formatted, summary)
             except Exception:
-                table.add_row(log_file.name, "Error reading log")
+                table.add_row(log_name, "Error reading log")
 
         console.print(table)
         console.print(f"\n📁 Log directory: [bold]{log_dir}[/bold]")
@@ -201,20 +299,43 @@ def logs(recent, count):
 
 
 @main.command()
-def status():
+@click.option("--no-stats", is_flag=True, help="Skip scanning session logs for statistics")
+def status(no_stats):
     """Show project status and configuration"""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from .core.workflow_manager import WorkflowManager
+
+    console = _console()
+    executor = None
+
     try:
         config = ContextFlowConfig()
 
+        # Build every section before the stats worker starts reading the config
+        config.load_sections()
+        project = config.project
+        workflow = config.workflow
+        ai_context = config.ai_context
+
+        # Scan the session logs in the background while the other panels render
+        if not no_stats:
+            executor = ThreadPoolExecutor(max_workers=1)
+            stats_future = executor.submit(WorkflowManager(config).get_session_statistics)
+
         # Project info
+        project_lines = [
+            f"[bold]{project.name}[/bold]",
+            f"Type: {project.type}",
+            f"Version: {project.version}",
+            f"Description: {project.description}",
+        ]
         console.print(
             Panel.fit(
-                f"[bold]{config.project.name}[/bold]\n"
-                f"Type: {config.project.type}\n"
-                f"Version: {config.project.version}\n"
-                f"Description: {config.project.description}",
-                title="📁 Project Information",
-                border_style="blue",
+                "\n".join(project_lines), title="📁 Project Information", border_style="blue"
             )
         )
 
@@ -223,56 +344,66 @@ def status():
         integrations_table.add_column("Integration", style="cyan")
         integrations_table.add_column("Status", style="white")
 
-        for integration in ["confluence", "jira", "github", "notion", "slack"]:
-            status = "✅ Enabled" if config.is_integration_enabled(integration) else "❌ Disabled"
+        for integration in SUPPORTED_INTEGRATIONS:
+            status = ENABLED if config.is_integration_enabled(integration) else DISABLED
             integrations_table.add_row(integration.title(), status)
 
         console.print(integrations_table)
 
         # Workflow settings
+        workflow_lines = [
+            f"Mandatory Updates: {YES if workflow.mandatory_session_updates else NO}",
+            "Work Item References: "
+            f"{REQUIRED if workflow.require_work_item_references else OPTIONAL}",
+            f"Auto Refresh Context: {YES if ai_context.auto_refresh else NO}",
+            f"Session Log Retention: {workflow.session_log_retention_days} days",
+        ]
         console.print(
             Panel.fit(
-                f"Mandatory Updates: {'✅ Yes' if config.workflow.mandatory_session_updates else '❌ No'}\n"
-                f"Work Item References: {'✅ Required' if config.workflow.require_work_item_references else '❌ Optional'}\n"
-                f"Auto Refresh Context: {'✅ Yes' if config.ai_context.auto_refresh else '❌ No'}\n"
-                f"Session Log Retention: {config.workflow.session_log_retention_days} days",
-                title="⚙️ Workflow Configuration",
-                border_style="green",
+                "\n".join(workflow_lines), title="⚙️ Workflow Configuration", border_style="green"
             )
         )
 
         # File locations
+        location_lines = [
+            f"Context Directory: {config.get_context_directory()}",
+            f"Session Logs: {config.get_session_log_directory()}",
+            f"Config File: {config.config_path or 'Not found'}",
+        ]
         console.print(
-            Panel.fit(
-                f"Context Directory: {config.get_context_directory()}\n"
-                f"Session Logs: {config.get_session_log_directory()}\n"
-                f"Config File: {config.config_path or 'Not found'}",
-                title="📁 File Locations",
-                border_style="yellow",
-            )
+            Panel.fit("\n".join(location_lines), title="📁 File Locations", border_style="yellow")
         )
 
         # Session statistics
-        updater = SessionUpdater(config)
-        stats = updater.get_session_statistics()
-
-        console.print(
-            Panel.fit(
-                f"Total Sessions: {stats['total_sessions']}\n"
-                f"Recent Sessions (30 days): {stats['recent_sessions']}",
-                title="📊 Session Statistics",
-                border_style="magenta",
+        if not no_stats:
+            stats = stats_future.result()
+
+            console.print(
+                Panel.fit(
+                    f"Total Sessions: {stats['total_sessions']}\n"
+                    f"Recent Sessions (30 days): {stats['recent_sessions']}",
+                    title="📊 Session Statistics",
+                    border_style="magenta",
+                )
             )
-        )
 
     except Exception as e:
         console.print(f"❌ Error getting status: {e}")
         sys.exit(1)
+    finally:
+        if executor:
+            executor.shutdown(wait=False)
 
 
 @main.command()
 def templates():
     """List available project templates"""
+    from rich.table import Table
+
+    from .templates.project_templates import ProjectTemplates
+
+    console = _console()
+
     try:
         templates = ProjectTemplates()
         available_templates = templates.get_available_templates()
@@ -300,14 +431,14 @@ def templates():
 @click.argument("integration", required=True)
 def setup(integration):
     """Setup credentials for an integration"""
+    console = _console()
+
     try:
         config = ContextFlowConfig()
 
-        valid_integrations = ["confluence", "jira", "github", "notion", "slack"]
-
-        if integration not in valid_integrations:
+        if integration not in VALID_INTEGRATIONS:
             console.print(f"Invalid integration: {integration}")
-            console.print(f"Valid options: {', '.join(valid_integrations)}")
+            console.print(f"Valid options: {', '.join(SUPPORTED_INTEGRATIONS)}")
             sys.exit(1)
 
         console.print(f"Setting up {integration.title()} integration...")
@@ -321,6 +452,10 @@ def setup(integration):
 @main.command()
 def credentials():
     """List stored credentials"""
+    from rich.table import Table
+
+    console = _console()
+
     try:
         config = ContextFlowConfig()
         stored = config.list_stored_credentials()
@@ -350,7 +485,14 @@ def credentials():
 @click.option("--confirm", is_flag=True, help="Skip confirmation prompt")
 def remove_credentials(integration, confirm):
     """Remove stored credentials for an integration"""
+    console = _console()
+
     try:
+        if integration not in VALID_INTEGRATIONS:
+            console.print(f"Invalid integration: {integration}")
+            console.print(f"Valid options: {', '.join(SUPPORTED_INTEGRATIONS)}")
+            sys.exit(1)
+
         config = ContextFlowConfig()
 
         if not confirm:
@@ -366,5 +508,13 @@ def remove_credentials(integration, confirm):
         sys.exit(1)
 
 
+def entry():
+    """Console script entry point, answering `context --quick` before Click dispatch"""
+    if sys.argv[1:] in QUICK_CONTEXT_ARGS or sys.argv[1:] in RAW_QUICK_CONTEXT_ARGS:
+        run_quick_context(raw=sys.argv[1:] in RAW_QUICK_CONTEXT_ARGS)
+    else:
+        main()
+
+
 if __name__ == "__main__":
-    main()
+    entry()
@@ -3,12 +3,104 @@ ContextFlow Configuration Management
 """
 
 import os
+import json
+import hashlib
 import yaml
-import keyring
-import getpass
+import pickle
+import threading
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Optional
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, fields
+
+# Prefer the libyaml C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
+# Sections and fields are written in dataclass order, so no key sorting needed
+YAML_DUMP_OPTIONS = {
+    "Dumper": YamlDumper,
+    "default_flow_style": False,
+    "indent": 2,
+    "sort_keys": False,
+}
+
+# orjson is an optional speedup for the keyring credential entries
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Look for config files in order of preference
+CONFIG_FILE_NAMES = (
+    "contextflow.yaml",
+    "contextflow.yml",
+    ".contextflow.yaml",
+    ".contextflow.yml",
+)
+
+CONFIG_SECTIONS = ("project", "integrations", "ai_context", "workflow")
+
+SUPPORTED_INTEGRATIONS = ("confluence", "jira", "github", "notion", "slack")
+
+# Common credential types
+CREDENTIAL_TYPES = ("username", "password", "api_token", "token")
+
+# Credentials requested by `contextflow setup <integration>`, in prompt order
+INTEGRATION_PROMPTS = {
+    "confluence": [
+        ("username", "Confluence username/email"),
+        ("api_token", "Confluence API token"),
+    ],
+    "jira": [("username", "JIRA username/email"), ("api_token", "JIRA API token")],
+    "github": [("token", "GitHub personal access token")],
+    "notion": [("token", "Notion integration token")],
+    "slack": [("token", "Slack bot token")],
+}
+
+# Credential types read without echoing them to the terminal
+SECRET_CREDENTIAL_TYPES = frozenset(("password", "token", "api_token"))
+
+# Keyring entry recording that per-field credentials were consolidated
+CREDENTIAL_SCHEMA_KEY = "_credential_schema"
+CREDENTIAL_SCHEMA_VERSION = "2"
+
+# Config file found for each working directory during this process. Misses are
+# not cached so a config created later (e.g. by `contextflow init`) is found.
+_config_path_cache: Dict[str, str] = {}
+
+
+def _encode_credentials(credentials: Dict[str, str]) -> str:
+    """Serialize an integration's credentials for keyring storage"""
+    if orjson is not None:
+        return orjson.dumps(credentials).decode("utf-8")
+    return json.dumps(credentials)
+
+
+def _decode_credentials(stored: str) -> Dict[str, str]:
+    """Deserialize an integration's credentials from keyring storage"""
+    if orjson is not None:
+        return orjson.loads(stored)
+    return json.loads(stored)
+
+
+def _search_config_file(start_dir: str) -> Optional[str]:
+    """Search start_dir and its parents for a config file"""
+    directory = start_dir
+    while True:
+        for config_name in CONFIG_FILE_NAMES:
+            config_path = os.path.join(directory, config_name)
+            if os.path.isfile(config_path):
+                return config_path
+
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
 
 
 @dataclass
@@ -57,158 +149,177 @@ class WorkflowConfig:
     session_log_directory: str = "session-logs"
 
 
+def _merge_section(current, section_data: Optional[Dict[str, Any]]):
+    """Build a new config section with values from YAML layered over the current ones"""
+    if not section_data:
+        return current
+
+    valid_fields = {f.name for f in fields(current)}
+    merged = asdict(current)
+    merged.update((key, value) for key, value in section_data.items() if key in valid_fields)
+    return type(current)(**merged)
+
+
 class ContextFlowConfig:
     """Main ContextFlow configuration manager with secure secrets handling"""
 
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path or self._find_config_file()
-        self.project = ProjectConfig()
-        self.integrations = IntegrationConfig()
-        self.ai_context = AIContextConfig()
-        self.workflow = WorkflowConfig()
         self._keyring_service = "contextflow"
+        self._credentials_migrated = False
+
+        # The config file is parsed and each section built on first access
+        self._config_data: Optional[Dict[str, Any]] = None
+        # Sections may be first accessed from worker threads, so parse and build under a lock
+        self._load_lock = threading.RLock()
+
+    @cached_property
+    def project(self) -> ProjectConfig:
+        """Project settings"""
+        return self._build_section("project", ProjectConfig())
 
-        if self.config_path and os.path.exists(self.config_path):
-            self.load_config()
+    @cached_property
+    def integrations(self) -> IntegrationConfig:
+        """Integration settings"""
+        return self._build_section("integrations", IntegrationConfig())
+
+    @cached_property
+    def ai_context(self) -> AIContextConfig:
+        """AI context settings"""
+        return self._build_section("ai_context", AIContextConfig())
+
+    @cached_property
+    def workflow(self) -> WorkflowConfig:
+        """Workflow settings"""
+        return self._build_section("workflow", WorkflowConfig())
 
     def _find_config_file(self) -> Optional[str]:
         """Find the configuration file in the current directory or parents"""
-        current_dir = Path.cwd()
+        current_dir = os.getcwd()
 
-        # Look for config files in order of preference
-        config_names = [
-            "contextflow.yaml",
-            "contextflow.yml",
-            ".contextflow.yaml",
-            ".contextflow.yml",
-        ]
+        # Reuse the previous lookup for this directory while that file still exists
+        cached_path = _config_path_cache.get(current_dir)
+        if cached_path and os.path.isfile(cached_path):
+            return cached_path
 
-        # Search current directory and parents
-        for parent in [current_dir] + list(current_dir.parents):
-            for config_name in config_names:
-                config_path = parent / config_name
-                if config_path.exists():
-                    return str(config_path)
+        config_path = _search_config_file(current_dir)
+        if config_path:
+            _config_path_cache[current_dir] = config_path
+        else:
+            _config_path_cache.pop(current_dir, None)
 
-        return None
+        return config_path
 
-    def load_config(self):
-        """Load configuration from YAML file"""
+    def _get_cache_path(self, path: str) -> Path:
+        """Get the path of the parsed config cache for one config file"""
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        # One small file per config path, so a load never reads other projects' entries
+        name = hashlib.sha1(path.encode("utf-8")).hexdigest()[:16]
+        return Path(cache_home) / "contextflow" / "config_cache" / f"{name}.pkl"
+
+    def _read_config_cache(self, cache_path: Path) -> Optional[tuple]:
+        """Read a cached (cache key, parsed config) entry, treating any failure as a miss"""
         try:
-            with open(self.config_path, "r", encoding="utf-8") as f:
-                config_data = yaml.safe_load(f) or {}
-
-            # Load project config
-            if "project" in config_data:
-                project_data = config_data["project"]
-                self.project = ProjectConfig(
-                    name=project_data.get("name", self.project.name),
-                    description=project_data.get("description", self.project.description),
-                    type=project_data.get("type", self.project.type),
-                    version=project_data.get("version", self.project.version),
-                    tags=project_data.get("tags", self.project.tags),
-                )
-
-            # Load integration config
-            if "integrations" in config_data:
-                integration_data = config_data["integrations"]
-                self.integrations = IntegrationConfig(
-                    confluence=integration_data.get("confluence", {}),
-                    jira=integration_data.get("jira", {}),
-                    github=integration_data.get("github", {}),
-                    notion=integration_data.get("notion", {}),
-                    slack=integration_data.get("slack", {}),
-                )
-
-            # Load AI context config
-            if "ai_context" in config_data:
-                ai_data = config_data["ai_context"]
-                self.ai_context = AIContextConfig(
-                    quick_context_file=ai_data.get(
-                        "quick_context_file", self.ai_context.quick_context_file
-                    ),
-                    full_context_file=ai_data.get(
-                        "full_context_file", self.ai_context.full_context_file
-                    ),
-                    context_directory=ai_data.get(
-                        "context_directory", self.ai_context.context_directory
-                    ),
-                    auto_refresh=ai_data.get("auto_refresh", self.ai_context.auto_refresh),
-                    max_context_length=ai_data.get(
-                        "max_context_length", self.ai_context.max_context_length
-                    ),
-                    include_recent_changes=ai_data.get(
-                        "include_recent_changes", self.ai_context.include_recent_changes
-                    ),
-                )
-
-            # Load workflow config
-            if "workflow" in config_data:
-                workflow_data = config_data["workflow"]
-                self.workflow = WorkflowConfig(
-                    mandatory_session_updates=workflow_data.get(
-                        "mandatory_session_updates", self.workflow.mandatory_session_updates
-                    ),
-                    require_work_item_references=workflow_data.get(
-                        "require_work_item_references", self.workflow.require_work_item_references
-                    ),
-                    session_log_retention_days=workflow_data.get(
-                        "session_log_retention_days", self.workflow.session_log_retention_days
-                    ),
-                    team_notifications=workflow_data.get(
-                        "team_notifications", self.workflow.team_notifications
-                    ),
-                    auto_archive_logs=workflow_data.get(
-                        "auto_archive_logs", self.workflow.auto_archive_logs
-                    ),
-                    session_log_directory=workflow_data.get(
-                        "session_log_directory", self.workflow.session_log_directory
-                    ),
-                )
+            with open(cache_path, "rb") as f:
+                entry = pickle.load(f)
+            return entry if isinstance(entry, tuple) and len(entry) == 2 else None
+        except Exception:
+            return None
 
-        except Exception as e:
-            print(f"Warning: Could not load config file {self.config_path}: {e}")
+    def _write_config_cache(self, cache_path: Path, entry: tuple):
+        """Atomically write a cached (cache key, parsed config) entry"""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            # The parsed config may hold plaintext tokens, so keep the cache private to the user
+            cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with open(fd, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            # The cache is only an optimization, never fail a config load over it
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def _read_config_data(self) -> Dict[str, Any]:
+        """Parse the config file, reusing the cached result while the file is unchanged"""
+        path = os.path.abspath(self.config_path)
+        stat = os.stat(path)
+        cache_key = (path, stat.st_mtime_ns, stat.st_size)
+
+        cache_path = self._get_cache_path(path)
+        entry = self._read_config_cache(cache_path)
+        if entry and entry[0] == cache_key:
+            return entry[1]
+
+        # libyaml decodes UTF-8 itself, so hand it the raw bytes
+        config_data = yaml.load(Path(path).read_bytes(), Loader=YamlLoader) or {}
+
+        # Replace this file's previous entry with the fresh parse
+        self._write_config_cache(cache_path, (cache_key, config_data))
+
+        return config_data
+
+    def _get_config_data(self) -> Dict[str, Any]:
+        """Get the parsed config file, reading it on first use"""
+        with self._load_lock:
+            if self._config_data is None:
+                config_data = {}
+                if self.config_path:
+                    # _read_config_data stats the file anyway, so no separate exists() check
+                    try:
+                        config_data = self._read_config_data()
+                    except FileNotFoundError:
+                        pass  # Config path given but not created yet, use defaults
+                    except Exception as e:
+                        print(f"Warning: Could not load config file {self.config_path}: {e}")
+                self._config_data = config_data
+
+            return self._config_data
+
+    def _build_section(self, section_name: str, default):
+        """Build a config section from the parsed file, falling back to defaults"""
+        with self._load_lock:
+            # Another thread may have built the section while this one waited
+            if section_name in self.__dict__:
+                return self.__dict__[section_name]
+            try:
+                section = _merge_section(default, self._get_config_data().get(section_name))
+            except Exception as e:
+                print(f"Warning: Could not load {section_name} from {self.config_path}: {e}")
+                section = default
+            self.__dict__[section_name] = section
+            return section
+
+    def load_sections(self):
+        """Build every config section now instead of on first access"""
+        for section_name in CONFIG_SECTIONS:
+            getattr(self, section_name)
+
+    def load_config(self):
+        """Load configuration from YAML file"""
+        # Forget the parsed file and built sections so they are rebuilt on next access
+        with self._load_lock:
+            self._config_data = None
+            for section_name in CONFIG_SECTIONS:
+                self.__dict__.pop(section_name, None)
 
     def save_config(self, config_path: Optional[str] = None):
         """Save current configuration to YAML file"""
         save_path = config_path or self.config_path or "contextflow.yaml"
 
         config_data = {
-            "project": {
-                "name": self.project.name,
-                "description": self.project.description,
-                "type": self.project.type,
-                "version": self.project.version,
-                "tags": self.project.tags,
-            },
-            "integrations": {
-                "confluence": self.integrations.confluence,
-                "jira": self.integrations.jira,
-                "github": self.integrations.github,
-                "notion": self.integrations.notion,
-                "slack": self.integrations.slack,
-            },
-            "ai_context": {
-                "quick_context_file": self.ai_context.quick_context_file,
-                "full_context_file": self.ai_context.full_context_file,
-                "context_directory": self.ai_context.context_directory,
-                "auto_refresh": self.ai_context.auto_refresh,
-                "max_context_length": self.ai_context.max_context_length,
-                "include_recent_changes": self.ai_context.include_recent_changes,
-            },
-            "workflow": {
-                "mandatory_session_updates": self.workflow.mandatory_session_updates,
-                "require_work_item_references": self.workflow.require_work_item_references,
-                "session_log_retention_days": self.workflow.session_log_retention_days,
-                "team_notifications": self.workflow.team_notifications,
-                "auto_archive_logs": self.workflow.auto_archive_logs,
-                "session_log_directory": self.workflow.session_log_directory,
-            },
+            "project": asdict(self.project),
+            "integrations": asdict(self.integrations),
+            "ai_context": asdict(self.ai_context),
+            "workflow": asdict(self.workflow),
         }
 
         try:
             with open(save_path, "w", encoding="utf-8") as f:
-                yaml.dump(config_data, f, default_flow_style=False, indent=2)
+                yaml.dump(config_data, f, **YAML_DUMP_OPTIONS)
             print(f"Configuration saved to {save_path}")
         except Exception as e:
             print(f"Error saving config to {save_path}: {e}")
@@ -235,29 +346,87 @@ class ContextFlowConfig:
         self.get_context_directory().mkdir(exist_ok=True)
         self.get_session_log_directory().mkdir(exist_ok=True)
 
+    def _migrate_legacy_credentials(self):
+        """Merge per-field keyring entries from older versions into one entry per integration"""
+        if self._credentials_migrated:
+            return
+        self._credentials_migrated = True
+
+        try:
+            import keyring
+            import keyring.errors
+
+            service = self._keyring_service
+            if keyring.get_password(service, CREDENTIAL_SCHEMA_KEY) == CREDENTIAL_SCHEMA_VERSION:
+                return
+
+            for integration in SUPPORTED_INTEGRATIONS:
+                legacy = {}
+                for cred_type in CREDENTIAL_TYPES:
+                    value = keyring.get_password(service, f"{integration}_{cred_type}")
+                    if value:
+                        legacy[cred_type] = value
+
+                if not legacy:
+                    continue
+
+                stored = keyring.get_password(service, integration)
+                credentials = {**legacy, **(_decode_credentials(stored) if stored else {})}
+                keyring.set_password(service, integration, _encode_credentials(credentials))
+
+                for cred_type in legacy:
+                    try:
+                        keyring.delete_password(service, f"{integration}_{cred_type}")
+                    except keyring.errors.PasswordDeleteError:
+                        pass
+
+            keyring.set_password(service, CREDENTIAL_SCHEMA_KEY, CREDENTIAL_SCHEMA_VERSION)
+        except Exception:
+            # Keyring unavailable, leave any legacy entries where they are
+            pass
+
+    def _read_credentials(self, integration: str) -> Dict[str, str]:
+        """Read all stored credentials for an integration in one keyring lookup"""
+        self._migrate_legacy_credentials()
+        try:
+            import keyring
+
+            stored = keyring.get_password(self._keyring_service, integration)
+            return _decode_credentials(stored) if stored else {}
+        except Exception:
+            # Silently handle keyring errors (credential doesn't exist, access denied, etc.)
+            return {}
+
     def set_credential(self, integration: str, credential_type: str, value: str):
         """Securely store a credential using keyring"""
-        key = f"{integration}_{credential_type}"
-        keyring.set_password(self._keyring_service, key, value)
+        self.set_credentials(integration, {credential_type: value})
         print(f"Credential stored securely for {integration} {credential_type}")
 
+    def set_credentials(self, integration: str, values: Dict[str, str]):
+        """Securely store several credentials for an integration in one keyring write"""
+        import keyring
+
+        credentials = self._read_credentials(integration)
+        credentials.update(values)
+        keyring.set_password(self._keyring_service, integration, _encode_credentials(credentials))
+
     def get_credential(self, integration: str, credential_type: str) -> Optional[str]:
         """Securely retrieve a credential using keyring"""
-        key = f"{integration}_{credential_type}"
-        try:
-            return keyring.get_password(self._keyring_service, key)
-        except Exception as e:
-            # Silently handle keyring errors (credential doesn't exist, access denied, etc.)
-            return None
+        return self._read_credentials(integration).get(credential_type)
+
+    def _read_credential_input(self, credential_type: str, prompt_text: str) -> str:
+        """Read a credential from the terminal, hiding secrets"""
+        if credential_type in SECRET_CREDENTIAL_TYPES:
+            import getpass
+
+            return getpass.getpass(f"{prompt_text}: ")
+        return input(f"{prompt_text}: ")
 
     def prompt_for_credential(
         self, integration: str, credential_type: str, prompt_text: str
     ) -> str:
         """Prompt user for credential and store it securely"""
-        if credential_type in ["password", "token", "api_token"]:
-            value = getpass.getpass(f"{prompt_text}: ")
-        else:
-            value = input(f"{prompt_text}: ")
+        value = self._read_credential_input(credential_type, prompt_text)
 
         if value:
             self.set_credential(integration, credential_type, value)
@@ -267,14 +436,12 @@ class ContextFlowConfig:
     def get_integration_credentials(self, integration_name: str) -> Dict[str, str]:
         """Get all credentials for an integration"""
         config = self.get_integration_config(integration_name)
+        stored = self._read_credentials(integration_name)
         credentials = {}
 
-        # Common credential types
-        credential_types = ["username", "password", "api_token", "token"]
-
-        for cred_type in credential_types:
+        for cred_type in CREDENTIAL_TYPES:
             # Always try to get from keyring first (credentials should be stored there)
-            stored_value = self.get_credential(integration_name, cred_type)
+            stored_value = stored.get(cred_type)
             if stored_value:
                 credentials[cred_type] = stored_value
             elif cred_type in config and config[cred_type]:  # Fallback to config file (for migration)
@@ -286,54 +453,48 @@ class ContextFlowConfig:
         """Interactive setup for integration credentials"""
         print(f"\nSetting up credentials for {integration_name.title()}")
 
-        if integration_name == "confluence":
-            username = self.prompt_for_credential(
-                "confluence", "username", "Confluence username/email"
-            )
-            api_token = self.prompt_for_credential(
-                "confluence", "api_token", "Confluence API token"
-            )
-
-        elif integration_name == "jira":
-            username = self.prompt_for_credential("jira", "username", "JIRA username/email")
-            api_token = self.prompt_for_credential("jira", "api_token", "JIRA API token")
-
-        elif integration_name == "github":
-            token = self.prompt_for_credential("github", "token", "GitHub personal access token")
+        # Collect every answer first, then store them with a single keyring write
+        values = {}
+        for credential_type, prompt_text in INTEGRATION_PROMPTS.get(integration_name, []):
+            value = self._read_credential_input(credential_type, prompt_text)
+            if value:
+                values[credential_type] = value
 
-        elif integration_name == "notion":
-            token = self.prompt_for_credential("notion", "token", "Notion integration token")
-
-        elif integration_name == "slack":
-            token = self.prompt_for_credential("slack", "token", "Slack bot token")
+        if values:
+            self.set_credentials(integration_name, values)
 
         print(f"Credentials for {integration_name.title()} stored securely!")
 
     def remove_credentials(self, integration_name: str):
         """Remove stored credentials for an integration"""
-        credential_types = ["username", "password", "api_token", "token"]
+        import keyring
+        import keyring.errors
 
-        for cred_type in credential_types:
-            try:
-                key = f"{integration_name}_{cred_type}"
-                keyring.delete_password(self._keyring_service, key)
-            except keyring.errors.PasswordDeleteError:
-                pass  # Credential doesn't exist
+        self._migrate_legacy_credentials()
+        try:
+            keyring.delete_password(self._keyring_service, integration_name)
+        except keyring.errors.PasswordDeleteError:
+            pass  # Credential doesn't exist
 
         print(f"Credentials removed for {integration_name.title()}")
 
     def list_stored_credentials(self) -> Dict[str, list]:
         """List which integrations have stored credentials"""
-        integrations = ["confluence", "jira", "github", "notion", "slack"]
         credential_types = ["username", "api_token", "token"]
 
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Migrate once up front, then overlap the blocking keyring lookups
+        self._migrate_legacy_credentials()
+        with ThreadPoolExecutor(max_workers=len(SUPPORTED_INTEGRATIONS)) as executor:
+            all_credentials = executor.map(self._read_credentials, SUPPORTED_INTEGRATIONS)
+
         stored = {}
 
-        for integration in integrations:
-            stored_creds = []
-            for cred_type in credential_types:
-                if self.get_credential(integration, cred_type):
-                    stored_creds.append(cred_type)
+        for integration, credentials in zip(SUPPORTED_INTEGRATIONS, all_credentials):
+            stored_creds = [
+                cred_type for cred_type in credential_types if credentials.get(cred_type)
+            ]
 
             if stored_creds:
                 stored[integration] = stored_creds
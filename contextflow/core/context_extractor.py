@@ -3,14 +3,176 @@ ContextFlow AI Context Extractor
 Generic context extraction and formatting for any project type
 """
 
+import json
+import mmap
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import cached_property, lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 
 from .config import ContextFlowConfig
 
+# Session logs are scanned as bytes so only the extracted sections are decoded. Logs
+# written on Windows use CRLF line endings, which text-mode reads used to normalize.
+SESSION_SUMMARY_PATTERN = re.compile(rb"## Session Summary\r?\n\r?\n(.*?)\r?\n\r?\n", re.DOTALL)
+WORK_ITEM_SECTION_PATTERN = re.compile(
+    rb"### Work Items Referenced\r?\n(.*?)\r?\n\r?\n", re.DOTALL
+)
+WORK_ITEM_LINE_PATTERN = re.compile(rb"- ([^\r\n]+)")
+
+LOG_READER_WORKERS = 8
+
+# Session log windows in seconds: changes cover the last week, work items two weeks
+RECENT_CHANGES_WINDOW = 7 * 24 * 60 * 60
+WORK_ITEMS_WINDOW = 14 * 24 * 60 * 60
+SESSION_INDEX_FILE = ".session_index.json"
+
+# Common important directories
+KEY_DIRECTORIES = (
+    "src",
+    "lib",
+    "app",
+    "components",
+    "pages",
+    "api",
+    "docs",
+    "documentation",
+    "tests",
+    "test",
+    "spec",
+    "config",
+    "configs",
+    "settings",
+    "scripts",
+    "tools",
+    "assets",
+    "static",
+    "public",
+    "resources",
+)
+
+# Common config files
+CONFIG_FILES = (
+    "package.json",
+    "requirements.txt",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "Makefile",
+    "Dockerfile",
+    "docker-compose.yml",
+    ".env",
+    ".env.example",
+    "tsconfig.json",
+    "webpack.config.js",
+    "vite.config.js",
+    "tailwind.config.js",
+    "next.config.js",
+)
+
+# Documentation files
+DOC_FILES = (
+    "README.md",
+    "README.rst",
+    "CHANGELOG.md",
+    "CONTRIBUTING.md",
+    "LICENSE",
+    "LICENSE.md",
+    "INSTALL.md",
+    "USAGE.md",
+)
+
+# Every root entry name _analyze_file_structure looks for
+PROJECT_ROOT_NAMES = frozenset(KEY_DIRECTORIES + CONFIG_FILES + DOC_FILES)
+
+DOC_DIRECTORIES = ("docs", "documentation")
+MAX_DOCUMENTATION_FILES = 10
+
+
+def _iter_session_entries(log_dir: Path, cutoff_time: float) -> Iterator[os.DirEntry]:
+    """Yield session log entries modified after cutoff_time, using scandir's cached stat"""
+    with os.scandir(log_dir) as it:
+        for entry in it:
+            if (
+                entry.name.startswith("session_")
+                and entry.name.endswith(".md")
+                and entry.stat().st_mtime > cutoff_time
+            ):
+                yield entry
+
+
+def _atomic_write_text(path: Path, text: str):
+    """Write text to a temporary sibling file and rename it over path"""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(text, encoding="utf-8")
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+@lru_cache(maxsize=None)
+def _log_reader_pool() -> ThreadPoolExecutor:
+    """Shared thread pool for reading session logs"""
+    # Blocking reads on worker threads are portable; io_uring batching would need a
+    # Linux-only native binding for what is usually a handful of small files.
+    return ThreadPoolExecutor(max_workers=LOG_READER_WORKERS, thread_name_prefix="contextflow-log")
+
+
+def _decode_log_text(data: bytes) -> str:
+    """Decode an extracted session log section with normalized line endings"""
+    return data.decode("utf-8").replace("\r\n", "\n")
+
+
+def _parse_session_log(content: bytes) -> Dict[str, Any]:
+    """Extract the session summary and referenced work items from a session log"""
+    summary_match = SESSION_SUMMARY_PATTERN.search(content)
+    work_item_section = WORK_ITEM_SECTION_PATTERN.search(content)
+
+    return {
+        "summary": _decode_log_text(summary_match.group(1)).strip() if summary_match else None,
+        "work_items": (
+            [
+                _decode_log_text(item)
+                for item in WORK_ITEM_LINE_PATTERN.findall(work_item_section.group(1))
+            ]
+            if work_item_section
+            else []
+        ),
+    }
+
+
+def _read_session_log(path: str) -> Optional[Dict[str, Any]]:
+    """Parse a session log through a read-only memory map, returning None if it cannot be read"""
+    try:
+        with open(path, "rb") as f:
+            # Empty files cannot be mapped
+            if os.fstat(f.fileno()).st_size == 0:
+                return _parse_session_log(b"")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return _parse_session_log(mapped)
+    except Exception:
+        return None
+
+
+def _is_current_log_record(record: Any, mtime_ns: int) -> bool:
+    """Check a session index record is well formed and matches the log's mtime"""
+    return (
+        isinstance(record, dict)
+        and record.get("mtime_ns") == mtime_ns
+        and "summary" in record
+        and isinstance(record["summary"], (str, type(None)))
+        and isinstance(record.get("work_items"), list)
+    )
+
 
 class ContextExtractor:
     """Generic AI context extractor for any project type"""
@@ -19,6 +181,11 @@ class ContextExtractor:
         self.config = config or ContextFlowConfig()
         self.config.ensure_directories()
 
+        # Parsed session logs keyed by path, reused while a log's mtime is unchanged
+        self._log_index = self._load_log_index()
+        self._seen_log_paths = set()
+        self._log_index_dirty = False
+
         print("ContextFlow AI Context Extractor Initialized")
         print(f"Project: {self.config.project.name}")
         print(f"Type: {self.config.project.type}")
@@ -36,6 +203,7 @@ class ContextExtractor:
             self.generate_quick_context(project_context)
             self.generate_full_context(project_context)
             self.generate_usage_instructions()
+            self._save_log_index()
 
             print("AI context extraction and generation complete!")
             return True
@@ -46,6 +214,15 @@ class ContextExtractor:
 
     def gather_project_context(self) -> Dict[str, Any]:
         """Gather comprehensive project context"""
+        # One timestamp for the whole run, shared by the log scan and the generated files
+        now = datetime.now()
+
+        # Recent changes and work items come from one pass over the session logs
+        recent_changes, work_items = self._scan_recent_logs(
+            include_work_items=self.config.workflow.require_work_item_references,
+            now=now.timestamp(),
+        )
+
         context = {
             "project": {
                 "name": self.config.project.name,
@@ -56,10 +233,11 @@ class ContextExtractor:
             },
             "integrations": self._get_enabled_integrations(),
             "file_structure": self._analyze_file_structure(),
-            "recent_changes": self._get_recent_changes(),
-            "work_items": self._get_recent_work_items(),
+            "recent_changes": recent_changes,
+            "work_items": work_items,
             "documentation": self._find_documentation_files(),
             "configuration": self._get_configuration_info(),
+            "generated_at": now,
             "workflow": {
                 "mandatory_updates": self.config.workflow.mandatory_session_updates,
                 "work_item_references": self.config.workflow.require_work_item_references,
@@ -91,155 +269,162 @@ class ContextExtractor:
             "source_files": [],
         }
 
-        # Common important directories
-        important_dirs = [
-            "src",
-            "lib",
-            "app",
-            "components",
-            "pages",
-            "api",
-            "docs",
-            "documentation",
-            "tests",
-            "test",
-            "spec",
-            "config",
-            "configs",
-            "settings",
-            "scripts",
-            "tools",
-            "assets",
-            "static",
-            "public",
-            "resources",
-        ]
+        # List the root once; DirEntry caches the file type, so no per-name stat calls
+        with os.scandir(project_root) as it:
+            root_entries = {entry.name: entry for entry in it if entry.name in PROJECT_ROOT_NAMES}
 
-        for dir_name in important_dirs:
-            dir_path = project_root / dir_name
-            if dir_path.exists() and dir_path.is_dir():
-                structure["key_directories"].append(str(dir_path.relative_to(project_root)))
-
-        # Common config files
-        config_files = [
-            "package.json",
-            "requirements.txt",
-            "Cargo.toml",
-            "go.mod",
-            "pom.xml",
-            "build.gradle",
-            "Makefile",
-            "Dockerfile",
-            "docker-compose.yml",
-            ".env",
-            ".env.example",
-            "tsconfig.json",
-            "webpack.config.js",
-            "vite.config.js",
-            "tailwind.config.js",
-            "next.config.js",
-        ]
+        for dir_name in KEY_DIRECTORIES:
+            entry = root_entries.get(dir_name)
+            if entry is not None and entry.is_dir():
+                structure["key_directories"].append(dir_name)
 
-        for config_file in config_files:
-            file_path = project_root / config_file
-            if file_path.exists():
+        for config_file in CONFIG_FILES:
+            if config_file in root_entries:
                 structure["config_files"].append(config_file)
 
-        # Documentation files
-        doc_files = [
-            "README.md",
-            "README.rst",
-            "CHANGELOG.md",
-            "CONTRIBUTING.md",
-            "LICENSE",
-            "LICENSE.md",
-            "INSTALL.md",
-            "USAGE.md",
-        ]
-
-        for doc_file in doc_files:
-            file_path = project_root / doc_file
-            if file_path.exists():
+        for doc_file in DOC_FILES:
+            if doc_file in root_entries:
                 structure["documentation_files"].append(doc_file)
 
         return structure
 
     def _get_recent_changes(self) -> List[str]:
         """Get recent changes from session logs"""
-        changes = []
-        log_dir = self.config.get_session_log_directory()
-
-        if log_dir.exists():
-            # Get recent session logs (last 7 days)
-            recent_logs = []
-            cutoff_time = datetime.now().timestamp() - (7 * 24 * 60 * 60)
-
-            for log_file in log_dir.glob("session_*.md"):
-                if log_file.stat().st_mtime > cutoff_time:
-                    recent_logs.append(log_file)
-
-            # Sort by modification time (newest first)
-            recent_logs.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
-            # Extract summaries from recent logs
-            for log_file in recent_logs[:5]:  # Last 5 sessions
-                try:
-                    with open(log_file, "r", encoding="utf-8") as f:
-                        content = f.read()
-                        # Extract the session summary section
-                        summary_match = re.search(
-                            r"## Session Summary\n\n(.*?)\n\n", content, re.DOTALL
-                        )
-                        if summary_match:
-                            summary = summary_match.group(1).strip()
-                            changes.append(f"Recent: {summary[:100]}...")
-                except Exception:
-                    continue
-
-        return changes
+        return self._scan_recent_logs(include_work_items=False)[0]
 
     def _get_recent_work_items(self) -> List[str]:
         """Get recent work items from session logs"""
-        work_items = set()
+        return self._scan_recent_logs()[1]
+
+    @cached_property
+    def _session_log_entries(self) -> List[os.DirEntry]:
+        """Session logs from the last two weeks, newest first, listed once per extractor"""
         log_dir = self.config.get_session_log_directory()
+        if not log_dir.exists():
+            return []
+
+        cutoff_time = datetime.now().timestamp() - WORK_ITEMS_WINDOW
+        entries = list(_iter_session_entries(log_dir, cutoff_time))
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+        return entries
+
+    def _scan_recent_logs(
+        self, include_work_items: bool = True, now: Optional[float] = None
+    ) -> Tuple[List[str], List[str]]:
+        """Collect recent changes and work items, reading each session log at most once"""
+        changes = []
+        work_items = set()
+
+        if now is None:
+            now = datetime.now().timestamp()
+        changes_cutoff = now - RECENT_CHANGES_WINDOW
+        cutoff_time = now - WORK_ITEMS_WINDOW if include_work_items else changes_cutoff
+
+        # Entries are newest first, so both windows are prefixes of the listing
+        log_entries = [
+            entry for entry in self._session_log_entries if entry.stat().st_mtime > cutoff_time
+        ]
+        recent_logs = [entry for entry in log_entries if entry.stat().st_mtime > changes_cutoff]
+        recent_logs = recent_logs[:5]  # Last 5 sessions
+
+        records = self._get_session_records(log_entries if include_work_items else recent_logs)
+
+        for log_entry in recent_logs:
+            record = records.get(log_entry.path)
+            if record is not None and record["summary"] is not None:
+                changes.append(f"Recent: {record['summary'][:100]}...")
+
+        if include_work_items:
+            for record in records.values():
+                work_items.update(record["work_items"])
+
+        return changes, list(work_items)
 
-        if log_dir.exists():
-            # Get recent session logs
-            cutoff_time = datetime.now().timestamp() - (14 * 24 * 60 * 60)  # Last 2 weeks
-
-            for log_file in log_dir.glob("session_*.md"):
-                if log_file.stat().st_mtime > cutoff_time:
-                    try:
-                        with open(log_file, "r", encoding="utf-8") as f:
-                            content = f.read()
-                            # Extract work items
-                            work_item_section = re.search(
-                                r"### Work Items Referenced\n(.*?)\n\n", content, re.DOTALL
-                            )
-                            if work_item_section:
-                                items = re.findall(r"- (.+)", work_item_section.group(1))
-                                work_items.update(items)
-                    except Exception:
-                        continue
-
-        return list(work_items)
+    def _get_session_records(self, entries: List[os.DirEntry]) -> Dict[str, Dict[str, Any]]:
+        """Parse session logs by path, reusing the session index for unchanged files"""
+        records = {}
+        stale = []
+
+        for entry in entries:
+            mtime_ns = entry.stat().st_mtime_ns
+            self._seen_log_paths.add(entry.path)
+            record = self._log_index.get(entry.path)
+            if _is_current_log_record(record, mtime_ns):
+                records[entry.path] = record
+            else:
+                stale.append((entry.path, {"mtime_ns": mtime_ns}))
+
+        # Only new or modified logs are read, in parallel; unreadable logs are skipped
+        paths = [path for path, _ in stale]
+        parsed_logs = _log_reader_pool().map(_read_session_log, paths)
+        for (path, record), parsed in zip(stale, parsed_logs):
+            if parsed is not None:
+                record.update(parsed)
+                records[path] = self._log_index[path] = record
+                self._log_index_dirty = True
+
+        return records
+
+    def _get_log_index_path(self) -> Path:
+        """Get the path of the session index file"""
+        return self.config.get_context_directory() / SESSION_INDEX_FILE
+
+    def _load_log_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the session index, returning an empty index if it is missing or invalid"""
+        try:
+            with open(self._get_log_index_path(), "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return index if isinstance(index, dict) else {}
+
+    def _save_log_index(self):
+        """Atomically write the session index, dropping logs no longer in range"""
+        index = {
+            path: record
+            for path, record in self._log_index.items()
+            if path in self._seen_log_paths
+        }
+        if not self._log_index_dirty and len(index) == len(self._log_index):
+            return
+
+        try:
+            _atomic_write_text(self._get_log_index_path(), json.dumps(index))
+        except Exception:
+            pass  # The index is only an optimization, never fail context generation over it
 
     def _find_documentation_files(self) -> List[str]:
         """Find key documentation files"""
-        docs = []
         project_root = Path.cwd()
+        readmes = []
+        doc_tree_files = []
+        top_level_docs = []
+
+        # One walk over the root, descending only into documentation directories
+        for dirpath, dirnames, filenames in os.walk(project_root):
+            if dirpath == str(project_root):
+                dirnames[:] = [name for name in DOC_DIRECTORIES if name in dirnames]
+                for filename in filenames:
+                    if filename.startswith("README"):
+                        readmes.append(filename)
+                    elif filename.endswith(".md"):
+                        top_level_docs.append(filename)
+            else:
+                relative_dir = os.path.relpath(dirpath, project_root)
+                doc_tree_files.extend(
+                    os.path.join(relative_dir, filename)
+                    for filename in filenames
+                    if filename.endswith(".md")
+                )
 
-        # Look for documentation in common locations
-        doc_patterns = ["README*", "docs/**/*.md", "documentation/**/*.md", "*.md"]
-
-        for pattern in doc_patterns:
-            for file_path in project_root.glob(pattern):
-                if file_path.is_file():
-                    relative_path = str(file_path.relative_to(project_root))
-                    if relative_path not in docs:
-                        docs.append(relative_path)
+            # READMEs and documentation directories take precedence over other top-level files
+            if len(readmes) + len(doc_tree_files) >= MAX_DOCUMENTATION_FILES:
+                break
 
-        return docs[:10]  # Limit to top 10 most relevant
+        # The buckets are disjoint and the walk visits each path once, so no de-duplication
+        docs = readmes + doc_tree_files + top_level_docs
+        return docs[:MAX_DOCUMENTATION_FILES]  # Limit to top 10 most relevant
 
     def _get_configuration_info(self) -> Dict[str, Any]:
         """Get configuration information"""
@@ -256,57 +441,61 @@ class ContextExtractor:
         """Generate quick AI context file"""
         context_dir = self.config.get_context_directory()
         quick_file = context_dir / self.config.ai_context.quick_context_file
+        project = project_context["project"]
+        file_structure = project_context["file_structure"]
+        workflow = project_context["workflow"]
+
+        parts = [
+            f"PROJECT: {project['name']}\n",
+            f"DESCRIPTION: {project['description']}\n",
+            f"TYPE: {project['type']}\n",
+            f"VERSION: {project['version']}\n\n",
+        ]
 
-        with open(quick_file, "w", encoding="utf-8") as f:
-            f.write(f"PROJECT: {project_context['project']['name']}\n")
-            f.write(f"DESCRIPTION: {project_context['project']['description']}\n")
-            f.write(f"TYPE: {project_context['project']['type']}\n")
-            f.write(f"VERSION: {project_context['project']['version']}\n\n")
-
-            if project_context["project"]["tags"]:
-                f.write(f"TAGS: {', '.join(project_context['project']['tags'])}\n\n")
-
-            f.write("INTEGRATIONS:\n")
-            for integration in project_context["integrations"]:
-                f.write(f"- {integration.title()}: ENABLED\n")
-            f.write("\n")
-
-            f.write("KEY DIRECTORIES:\n")
-            for directory in project_context["file_structure"]["key_directories"]:
-                f.write(f"- {directory}\n")
-            f.write("\n")
-
-            f.write("CONFIGURATION FILES:\n")
-            for config_file in project_context["file_structure"]["config_files"]:
-                f.write(f"- {config_file}\n")
-            f.write("\n")
-
-            if project_context["recent_changes"]:
-                f.write("RECENT CHANGES:\n")
-                for change in project_context["recent_changes"][:3]:
-                    f.write(f"- {change}\n")
-                f.write("\n")
-
-            if project_context["work_items"]:
-                f.write("ACTIVE WORK ITEMS:\n")
-                for item in project_context["work_items"][:5]:
-                    f.write(f"- {item}\n")
-                f.write("\n")
-
-            f.write("WORKFLOW SETTINGS:\n")
-            f.write(
-                f"- Mandatory session updates: {'YES' if project_context['workflow']['mandatory_updates'] else 'NO'}\n"
-            )
-            f.write(
-                f"- Work item references required: {'YES' if project_context['workflow']['work_item_references'] else 'NO'}\n"
-            )
-            f.write(f"- Session logs: {project_context['workflow']['session_logs']}\n")
-            f.write(f"- Context directory: {project_context['workflow']['context_directory']}\n\n")
-
-            f.write("CONTEXTFLOW COMMANDS:\n")
-            f.write('- Update session: contextflow update "[session summary]"\n')
-            f.write("- Refresh context: contextflow context --refresh\n")
-            f.write("- View logs: contextflow logs --recent\n")
+        if project["tags"]:
+            parts.append(f"TAGS: {', '.join(project['tags'])}\n\n")
+
+        parts.append("INTEGRATIONS:\n")
+        parts.extend(
+            f"- {integration.title()}: ENABLED\n" for integration in project_context["integrations"]
+        )
+        parts.append("\n")
+
+        parts.append("KEY DIRECTORIES:\n")
+        parts.extend(f"- {directory}\n" for directory in file_structure["key_directories"])
+        parts.append("\n")
+
+        parts.append("CONFIGURATION FILES:\n")
+        parts.extend(f"- {config_file}\n" for config_file in file_structure["config_files"])
+        parts.append("\n")
+
+        if project_context["recent_changes"]:
+            parts.append("RECENT CHANGES:\n")
+            parts.extend(f"- {change}\n" for change in project_context["recent_changes"][:3])
+            parts.append("\n")
+
+        if project_context["work_items"]:
+            parts.append("ACTIVE WORK ITEMS:\n")
+            parts.extend(f"- {item}\n" for item in project_context["work_items"][:5])
+            parts.append("\n")
+
+        parts.append("WORKFLOW SETTINGS:\n")
+        parts.append(
+            f"- Mandatory session updates: {'YES' if workflow['mandatory_updates'] else 'NO'}\n"
+        )
+        parts.append(
+            "- Work item references required: "
+            f"{'YES' if workflow['work_item_references'] else 'NO'}\n"
+        )
+        parts.append(f"- Session logs: {workflow['session_logs']}\n")
+        parts.append(f"- Context directory: {workflow['context_directory']}\n\n")
+
+        parts.append("CONTEXTFLOW COMMANDS:\n")
+        parts.append('- Update session: contextflow update "[session summary]"\n')
+        parts.append("- Refresh context: contextflow context --refresh\n")
+        parts.append("- View logs: contextflow logs --recent\n")
+
+        _atomic_write_text(quick_file, "".join(parts))
 
         print(f"   📄 Quick context generated: {quick_file}")
 
@@ -314,92 +503,94 @@ class ContextExtractor:
         """Generate full AI context file"""
         context_dir = self.config.get_context_directory()
         full_file = context_dir / self.config.ai_context.full_context_file
+        generated_at = project_context.get("generated_at") or datetime.now()
+        project = project_context["project"]
+        file_structure = project_context["file_structure"]
+        workflow = project_context["workflow"]
+
+        parts = [
+            f"# {project['name']} - AI Context\n\n",
+            f"**Generated:** {generated_at.strftime('%Y-%m-%d %H:%M:%S')}\n",
+            f"**Project Type:** {project['type']}\n\n",
+        ]
 
-        with open(full_file, "w", encoding="utf-8") as f:
-            f.write(f"# {project_context['project']['name']} - AI Context\n\n")
-            f.write(f"**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write(f"**Project Type:** {project_context['project']['type']}\n\n")
-
-            f.write("## 🎯 Project Overview\n\n")
-            f.write(f"**Name:** {project_context['project']['name']}\n")
-            f.write(f"**Description:** {project_context['project']['description']}\n")
-            f.write(f"**Version:** {project_context['project']['version']}\n")
-            if project_context["project"]["tags"]:
-                f.write(f"**Tags:** {', '.join(project_context['project']['tags'])}\n")
-            f.write("\n")
-
-            f.write("## 🔗 Integrations\n\n")
-            if project_context["integrations"]:
-                for integration in project_context["integrations"]:
-                    f.write(f"- **{integration.title()}:** Enabled\n")
-            else:
-                f.write("- No integrations currently enabled\n")
-            f.write("\n")
-
-            f.write("## 📁 Project Structure\n\n")
-            f.write(f"**Root Directory:** {project_context['file_structure']['root']}\n\n")
-
-            if project_context["file_structure"]["key_directories"]:
-                f.write("**Key Directories:**\n")
-                for directory in project_context["file_structure"]["key_directories"]:
-                    f.write(f"- {directory}\n")
-                f.write("\n")
-
-            if project_context["file_structure"]["config_files"]:
-                f.write("**Configuration Files:**\n")
-                for config_file in project_context["file_structure"]["config_files"]:
-                    f.write(f"- {config_file}\n")
-                f.write("\n")
-
-            if project_context["file_structure"]["documentation_files"]:
-                f.write("**Documentation Files:**\n")
-                for doc_file in project_context["file_structure"]["documentation_files"]:
-                    f.write(f"- {doc_file}\n")
-                f.write("\n")
-
-            if project_context["recent_changes"]:
-                f.write("## 🔄 Recent Changes\n\n")
-                for change in project_context["recent_changes"]:
-                    f.write(f"- {change}\n")
-                f.write("\n")
-
-            if project_context["work_items"]:
-                f.write("## 🎫 Active Work Items\n\n")
-                for item in project_context["work_items"]:
-                    f.write(f"- {item}\n")
-                f.write("\n")
-
-            f.write("## ⚙️ Workflow Configuration\n\n")
-            f.write(
-                f"- **Mandatory session updates:** {'Enabled' if project_context['workflow']['mandatory_updates'] else 'Disabled'}\n"
-            )
-            f.write(
-                f"- **Work item references required:** {'Yes' if project_context['workflow']['work_item_references'] else 'No'}\n"
-            )
-            f.write(
-                f"- **Session logs directory:** {project_context['workflow']['session_logs']}\n"
-            )
-            f.write(
-                f"- **Context directory:** {project_context['workflow']['context_directory']}\n\n"
-            )
-
-            f.write("## 🚀 ContextFlow Commands\n\n")
-            f.write("```bash\n")
-            f.write("# Update session documentation\n")
-            f.write('contextflow update "[detailed session summary]"\n\n')
-            f.write("# Refresh AI context\n")
-            f.write("contextflow context --refresh\n\n")
-            f.write("# View recent session logs\n")
-            f.write("contextflow logs --recent\n\n")
-            f.write("# Show project status\n")
-            f.write("contextflow status\n")
-            f.write("```\n\n")
-
-            f.write("---\n\n")
-            f.write("*This context file is automatically generated by ContextFlow. ")
-            f.write(
-                "Use `contextflow context --refresh` to update with latest project information.*\n"
+        parts.append("## 🎯 Project Overview\n\n")
+        parts.append(f"**Name:** {project['name']}\n")
+        parts.append(f"**Description:** {project['description']}\n")
+        parts.append(f"**Version:** {project['version']}\n")
+        if project["tags"]:
+            parts.append(f"**Tags:** {', '.join(project['tags'])}\n")
+        parts.append("\n")
+
+        parts.append("## 🔗 Integrations\n\n")
+        if project_context["integrations"]:
+            parts.extend(
+                f"- **{integration.title()}:** Enabled\n"
+                for integration in project_context["integrations"]
             )
+        else:
+            parts.append("- No integrations currently enabled\n")
+        parts.append("\n")
+
+        parts.append("## 📁 Project Structure\n\n")
+        parts.append(f"**Root Directory:** {file_structure['root']}\n\n")
+
+        if file_structure["key_directories"]:
+            parts.append("**Key Directories:**\n")
+            parts.extend(f"- {directory}\n" for directory in file_structure["key_directories"])
+            parts.append("\n")
+
+        if file_structure["config_files"]:
+            parts.append("**Configuration Files:**\n")
+            parts.extend(f"- {config_file}\n" for config_file in file_structure["config_files"])
+            parts.append("\n")
+
+        if file_structure["documentation_files"]:
+            parts.append("**Documentation Files:**\n")
+            parts.extend(f"- {doc_file}\n" for doc_file in file_structure["documentation_files"])
+            parts.append("\n")
+
+        if project_context["recent_changes"]:
+            parts.append("## 🔄 Recent Changes\n\n")
+            parts.extend(f"- {change}\n" for change in project_context["recent_changes"])
+            parts.append("\n")
+
+        if project_context["work_items"]:
+            parts.append("## 🎫 Active Work Items\n\n")
+            parts.extend(f"- {item}\n" for item in project_context["work_items"])
+            parts.append("\n")
+
+        parts.append("## ⚙️ Workflow Configuration\n\n")
+        parts.append(
+            "- **Mandatory session updates:** "
+            f"{'Enabled' if workflow['mandatory_updates'] else 'Disabled'}\n"
+        )
+        parts.append(
+            "- **Work item references required:** "
+            f"{'Yes' if workflow['work_item_references'] else 'No'}\n"
+        )
+        parts.append(f"- **Session logs directory:** {workflow['session_logs']}\n")
+        parts.append(f"- **Context directory:** {workflow['context_directory']}\n\n")
+
+        parts.append("## 🚀 ContextFlow Commands\n\n")
+        parts.append("```bash\n")
+        parts.append("# Update session documentation\n")
+        parts.append('contextflow update "[detailed session summary]"\n\n')
+        parts.append("# Refresh AI context\n")
+        parts.append("contextflow context --refresh\n\n")
+        parts.append("# View recent session logs\n")
+        parts.append("contextflow logs --recent\n\n")
+        parts.append("# Show project status\n")
+        parts.append("contextflow status\n")
+        parts.append("```\n\n")
+
+        parts.append("---\n\n")
+        parts.append("*This context file is automatically generated by ContextFlow. ")
+        parts.append(
+            "Use `contextflow context --refresh` to update with latest project information.*\n"
+        )
+
+        _atomic_write_text(full_file, "".join(parts))
 
         print(f"   📄 Full context generated: {full_file}")
 
@@ -408,40 +599,42 @@ class ContextExtractor:
         context_dir = self.config.get_context_directory()
         usage_file = context_dir / "HOW_TO_USE_CONTEXTFLOW.md"
 
-        with open(usage_file, "w", encoding="utf-8") as f:
-            f.write("# How to Use ContextFlow\n\n")
-            f.write("## 🎯 For New AI Sessions\n\n")
-            f.write("### Quick Context (30 seconds)\n")
-            f.write("```bash\n")
-            f.write(f"cat {self.config.ai_context.quick_context_file}\n")
-            f.write("```\n")
-            f.write("Copy the output and paste into new AI session.\n\n")
-
-            f.write("### Complete Context\n")
-            f.write("```bash\n")
-            f.write(f"cat {self.config.ai_context.full_context_file}\n")
-            f.write("```\n")
-            f.write("Use for comprehensive project understanding.\n\n")
-
-            f.write("## 🔄 End of Session (MANDATORY)\n\n")
-            f.write("```bash\n")
-            f.write('contextflow update "[your session summary]"\n')
-            f.write("```\n\n")
-
-            f.write("**Include in your summary:**\n")
-            f.write("- Work items referenced (tickets, issues, tasks)\n")
-            f.write("- Files created or modified\n")
-            f.write("- Features added or bugs fixed\n")
-            f.write("- Architecture or design changes\n\n")
-
-            f.write("## 📊 Other Commands\n\n")
-            f.write("```bash\n")
-            f.write("# Refresh context\n")
-            f.write("contextflow context --refresh\n\n")
-            f.write("# View recent logs\n")
-            f.write("contextflow logs --recent\n\n")
-            f.write("# Show project status\n")
-            f.write("contextflow status\n")
-            f.write("```\n")
+        parts = []
+        parts.append("# How to Use ContextFlow\n\n")
+        parts.append("## 🎯 For New AI Sessions\n\n")
+        parts.append("### Quick Context (30 seconds)\n")
+        parts.append("```bash\n")
+        parts.append(f"cat {self.config.ai_context.quick_context_file}\n")
+        parts.append("```\n")
+        parts.append("Copy the output and paste into new AI session.\n\n")
+
+        parts.append("### Complete Context\n")
+        parts.append("```bash\n")
+        parts.append(f"cat {self.config.ai_context.full_context_file}\n")
+        parts.append("```\n")
+        parts.append("Use for comprehensive project understanding.\n\n")
+
+        parts.append("## 🔄 End of Session (MANDATORY)\n\n")
+        parts.append("```bash\n")
+        parts.append('contextflow update "[your session summary]"\n')
+        parts.append("```\n\n")
+
+        parts.append("**Include in your summary:**\n")
+        parts.append("- Work items referenced (tickets, issues, tasks)\n")
+        parts.append("- Files created or modified\n")
+        parts.append("- Features added or bugs fixed\n")
+        parts.append("- Architecture or design changes\n\n")
+
+        parts.append("## 📊 Other Commands\n\n")
+        parts.append("```bash\n")
+        parts.append("# Refresh context\n")
+        parts.append("contextflow context --refresh\n\n")
+        parts.append("# View recent logs\n")
+        parts.append("contextflow logs --recent\n\n")
+        parts.append("# Show project status\n")
+        parts.append("contextflow status\n")
+        parts.append("```\n")
+
+        _atomic_write_text(usage_file, "".join(parts))
 
         print(f"   📖 Usage instructions generated: {usage_file}")
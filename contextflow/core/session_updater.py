@@ -6,14 +6,157 @@ Generic session documentation and workflow automation
 import os
 import re
 import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple
 
 from .config import ContextFlowConfig
-from ..integrations.confluence import ConfluenceIntegration
-from ..integrations.jira import JiraIntegration
-from ..integrations.github import GitHubIntegration
+
+try:
+    import ahocorasick
+except ImportError:  # Optional speedup, the keyword regex is used instead
+    ahocorasick = None
+
+# Work item references (flexible patterns), matched in a single pass
+WORK_ITEM_PATTERN = re.compile(
+    r"[A-Z]+-\d+"  # JIRA-style (PROJ-123)
+    r"|#\d+"  # GitHub-style (#123)
+    r"|issue-\d+"  # Generic issue references
+    r"|task-\d+",  # Generic task references
+    re.IGNORECASE,
+)
+
+# File changes (flexible patterns), matched in a single pass
+FILE_REFERENCE_PATTERN = re.compile(
+    r"[a-zA-Z0-9/_.-]+\.[a-zA-Z]+"  # File paths with extensions
+    r"|src/[a-zA-Z0-9/_.-]+"  # Source files
+    r"|docs/[a-zA-Z0-9/_.-]+"  # Documentation files
+)
+
+SESSION_LOG_TEMPLATE = """# ContextFlow Session Log
+
+**Project:** {project}
+**Type:** {type}
+**Timestamp:** {timestamp}
+
+## Session Summary
+
+{summary}
+
+## Parsed Updates
+
+**Categories:** {categories}
+**Work Items:** {work_item_count}
+**Files Changed:** {file_count}
+**Features Added:** {feature_count}
+**Bugs Fixed:** {bug_fix_count}
+
+"""
+
+# Session log section title and the updates key it lists
+SESSION_LOG_SECTIONS = (
+    ("Work Items Referenced", "work_items"),
+    ("Files Changed", "files_changed"),
+    ("Features Added", "features_added"),
+    ("Bugs Fixed", "bugs_fixed"),
+)
+
+# Summary keywords and the tags they contribute to a line. Category tags (feature, bugfix,
+# architecture, documentation) mark the summary; the others select lines for extraction.
+SUMMARY_KEYWORD_TAGS = {
+    "implemented": ("feature", "feature_verb"),
+    "added": ("feature", "feature_verb"),
+    "created": ("feature", "feature_verb"),
+    "new feature": ("feature", "feature_verb", "feature_noun"),
+    "enhancement": ("feature",),
+    "new": ("feature_verb",),
+    "feature": ("feature_noun",),
+    "component": ("feature_noun",),
+    "function": ("feature_noun",),
+    "endpoint": ("feature_noun",),
+    "page": ("feature_noun",),
+    "fixed": ("bugfix", "fix"),
+    "resolved": ("bugfix", "fix"),
+    "corrected": ("fix",),
+    "bug": ("bugfix",),
+    "issue": ("bugfix",),
+    "error": ("bugfix",),
+    "architecture": ("architecture", "architecture_change"),
+    "design": ("architecture", "architecture_change"),
+    "refactor": ("architecture", "architecture_change"),
+    "restructure": ("architecture", "architecture_change"),
+    "migrate": ("architecture_change",),
+    "documentation": ("documentation", "documentation_update"),
+    "docs": ("documentation", "documentation_update"),
+    "readme": ("documentation", "documentation_update"),
+    "guide": ("documentation", "documentation_update"),
+    "manual": ("documentation_update",),
+}
+
+# Longest keywords first so "new feature" wins over "new"
+SUMMARY_KEYWORD_PATTERN = re.compile(
+    "|".join(re.escape(term) for term in sorted(SUMMARY_KEYWORD_TAGS, key=len, reverse=True))
+)
+
+
+def _build_keyword_automaton():
+    """Build an Aho-Corasick automaton over the summary keywords, if available"""
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for term, tags in SUMMARY_KEYWORD_TAGS.items():
+        automaton.add_word(term, tags)
+    automaton.make_automaton()
+    return automaton
+
+
+SUMMARY_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# Category name and the updates key holding its extracted lines
+SUMMARY_CATEGORIES = (
+    ("feature", "features_added"),
+    ("bugfix", "bugs_fixed"),
+    ("architecture", "architecture_changes"),
+    ("documentation", "documentation_updates"),
+)
+
+
+def _keyword_tags(line_lower: str) -> Set[str]:
+    """Collect the tags of every summary keyword in a lowercased line"""
+    tags = set()
+    if SUMMARY_KEYWORD_AUTOMATON is not None:
+        # Reports every occurrence, including overlapping ones, in one pass over the line
+        for _, term_tags in SUMMARY_KEYWORD_AUTOMATON.iter(line_lower):
+            tags.update(term_tags)
+    else:
+        for match in SUMMARY_KEYWORD_PATTERN.finditer(line_lower):
+            tags.update(SUMMARY_KEYWORD_TAGS[match.group(0)])
+    return tags
+
+
+def _categorize_summary(session_summary: str) -> Tuple[Set[str], Dict[str, List[str]]]:
+    """Classify summary lines in one pass, returning categories and extracted lines"""
+    categories = set()
+    extracted = {key: [] for _, key in SUMMARY_CATEGORIES}
+
+    for line in session_summary.split("\n"):
+        tags = _keyword_tags(line.lower())
+        if not tags:
+            continue
+
+        categories.update(tags)
+        if "feature_verb" in tags and "feature_noun" in tags:
+            extracted["features_added"].append(line.strip())
+        if "fix" in tags:
+            extracted["bugs_fixed"].append(line.strip())
+        if "architecture_change" in tags:
+            extracted["architecture_changes"].append(line.strip())
+        if "documentation_update" in tags:
+            extracted["documentation_updates"].append(line.strip())
+
+    return categories, extracted
 
 
 class SessionUpdater:
@@ -34,8 +177,11 @@ class SessionUpdater:
 
     def _initialize_integrations(self):
         """Initialize enabled integrations"""
+        # Integration modules are imported only when enabled, as they pull in their clients
         if self.config.is_integration_enabled("confluence"):
             try:
+                from ..integrations.confluence import ConfluenceIntegration
+
                 self.integrations["confluence"] = ConfluenceIntegration(
                     self.config.get_integration_config("confluence"), self.config
                 )
@@ -45,6 +191,8 @@ class SessionUpdater:
 
         if self.config.is_integration_enabled("jira"):
             try:
+                from ..integrations.jira import JiraIntegration
+
                 self.integrations["jira"] = JiraIntegration(
                     self.config.get_integration_config("jira"), self.config
                 )
@@ -54,6 +202,8 @@ class SessionUpdater:
 
         if self.config.is_integration_enabled("github"):
             try:
+                from ..integrations.github import GitHubIntegration
+
                 self.integrations["github"] = GitHubIntegration(
                     self.config.get_integration_config("github"), self.config
                 )
@@ -73,10 +223,26 @@ class SessionUpdater:
             success_count = 0
             total_integrations = len(self.integrations)
 
-            for integration_name, integration in self.integrations.items():
+            # Integrations talk to separate services, so their network calls can overlap.
+            # Each one logs into its own buffer, printed as a block in configuration order.
+            messages = {integration_name: [] for integration_name in self.integrations}
+            with ThreadPoolExecutor(max_workers=max(1, total_integrations)) as executor:
+                pending = {
+                    integration_name: executor.submit(
+                        integration.update_from_session,
+                        updates,
+                        log=messages[integration_name].append,
+                    )
+                    for integration_name, integration in self.integrations.items()
+                    if hasattr(integration, "update_from_session")
+                }
+
+            for integration_name in self.integrations:
                 try:
-                    if hasattr(integration, "update_from_session"):
-                        integration.update_from_session(updates)
+                    if integration_name in pending:
+                        for message in messages[integration_name]:
+                            print(message)
+                        pending[integration_name].result()
                         print(f"   {integration_name.title()} updated")
                         success_count += 1
                     else:
@@ -102,12 +268,20 @@ class SessionUpdater:
 
     def parse_session_summary(self, session_summary: str) -> Dict[str, Any]:
         """Parse session summary to determine what needs updating"""
+        # Extract work item references and file changes, de-duplicated in first-seen order
+        work_items = dict.fromkeys(
+            match.group(0) for match in WORK_ITEM_PATTERN.finditer(session_summary)
+        )
+        files_changed = dict.fromkeys(
+            match.group(0) for match in FILE_REFERENCE_PATTERN.finditer(session_summary)
+        )
+
         updates = {
             "summary": session_summary,
             "timestamp": datetime.now().isoformat(),
             "project_type": self.config.project.type,
-            "work_items": [],
-            "files_changed": [],
+            "work_items": list(work_items),
+            "files_changed": list(files_changed),
             "features_added": [],
             "bugs_fixed": [],
             "architecture_changes": [],
@@ -115,169 +289,64 @@ class SessionUpdater:
             "categories": [],
         }
 
-        # Extract work item references (flexible patterns)
-        work_item_patterns = [
-            r"[A-Z]+-\d+",  # JIRA-style (PROJ-123)
-            r"#\d+",  # GitHub-style (#123)
-            r"issue-\d+",  # Generic issue references
-            r"task-\d+",  # Generic task references
-        ]
-
-        for pattern in work_item_patterns:
-            matches = re.findall(pattern, session_summary, re.IGNORECASE)
-            updates["work_items"].extend(matches)
-
-        # Extract file changes (flexible patterns)
-        file_patterns = [
-            r"[a-zA-Z0-9/_.-]+\.[a-zA-Z]+",  # File paths with extensions
-            r"src/[a-zA-Z0-9/_.-]+",  # Source files
-            r"docs/[a-zA-Z0-9/_.-]+",  # Documentation files
-        ]
-
-        for pattern in file_patterns:
-            matches = re.findall(pattern, session_summary)
-            updates["files_changed"].extend(matches)
-
         # Categorize changes based on keywords
-        summary_lower = session_summary.lower()
-
-        # Features
-        if any(
-            term in summary_lower
-            for term in ["implemented", "added", "created", "new feature", "enhancement"]
-        ):
-            updates["categories"].append("feature")
-            updates["features_added"] = self.extract_features(session_summary)
-
-        # Bug fixes
-        if any(term in summary_lower for term in ["fixed", "resolved", "bug", "issue", "error"]):
-            updates["categories"].append("bugfix")
-            updates["bugs_fixed"] = self.extract_bug_fixes(session_summary)
-
-        # Architecture changes
-        if any(
-            term in summary_lower for term in ["architecture", "design", "refactor", "restructure"]
-        ):
-            updates["categories"].append("architecture")
-            updates["architecture_changes"] = self.extract_architecture_changes(session_summary)
-
-        # Documentation updates
-        if any(term in summary_lower for term in ["documentation", "docs", "readme", "guide"]):
-            updates["categories"].append("documentation")
-            updates["documentation_updates"] = self.extract_documentation_updates(session_summary)
-
-        # Remove duplicates
-        updates["work_items"] = list(set(updates["work_items"]))
-        updates["files_changed"] = list(set(updates["files_changed"]))
-        updates["categories"] = list(set(updates["categories"]))
+        categories, extracted = _categorize_summary(session_summary)
+        for category, key in SUMMARY_CATEGORIES:
+            if category in categories:
+                updates["categories"].append(category)
+                updates[key] = extracted[key]
 
         return updates
 
     def extract_features(self, session_summary: str) -> List[str]:
         """Extract feature descriptions from session summary"""
-        features = []
-        lines = session_summary.split("\n")
-
-        for line in lines:
-            line_lower = line.lower()
-            if any(term in line_lower for term in ["implemented", "added", "created", "new"]):
-                if any(
-                    feature_term in line_lower
-                    for feature_term in ["feature", "component", "function", "endpoint", "page"]
-                ):
-                    features.append(line.strip())
-
-        return features
+        return _categorize_summary(session_summary)[1]["features_added"]
 
     def extract_bug_fixes(self, session_summary: str) -> List[str]:
         """Extract bug fix descriptions from session summary"""
-        fixes = []
-        lines = session_summary.split("\n")
-
-        for line in lines:
-            line_lower = line.lower()
-            if any(term in line_lower for term in ["fixed", "resolved", "corrected"]):
-                fixes.append(line.strip())
-
-        return fixes
+        return _categorize_summary(session_summary)[1]["bugs_fixed"]
 
     def extract_architecture_changes(self, session_summary: str) -> List[str]:
         """Extract architecture change descriptions"""
-        changes = []
-        lines = session_summary.split("\n")
-
-        for line in lines:
-            line_lower = line.lower()
-            if any(
-                term in line_lower
-                for term in ["architecture", "design", "refactor", "restructure", "migrate"]
-            ):
-                changes.append(line.strip())
-
-        return changes
+        return _categorize_summary(session_summary)[1]["architecture_changes"]
 
     def extract_documentation_updates(self, session_summary: str) -> List[str]:
         """Extract documentation update descriptions"""
-        updates = []
-        lines = session_summary.split("\n")
-
-        for line in lines:
-            line_lower = line.lower()
-            if any(
-                term in line_lower
-                for term in ["documentation", "docs", "readme", "guide", "manual"]
-            ):
-                updates.append(line.strip())
-
-        return updates
+        return _categorize_summary(session_summary)[1]["documentation_updates"]
 
     def create_session_log(self, session_summary: str, updates: Dict[str, Any]):
         """Create a log of the session for tracking"""
         log_dir = self.config.get_session_log_directory()
         log_dir.mkdir(exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Name the log after the timestamp recorded when the summary was parsed
+        timestamp = datetime.fromisoformat(updates["timestamp"]).strftime("%Y%m%d_%H%M%S")
         log_file = log_dir / f"session_{timestamp}.md"
 
-        with open(log_file, "w", encoding="utf-8") as f:
-            f.write(f"# ContextFlow Session Log\n\n")
-            f.write(f"**Project:** {self.config.project.name}\n")
-            f.write(f"**Type:** {self.config.project.type}\n")
-            f.write(f"**Timestamp:** {updates['timestamp']}\n\n")
-
-            f.write("## Session Summary\n\n")
-            f.write(f"{session_summary}\n\n")
-
-            f.write("## Parsed Updates\n\n")
-            f.write(f"**Categories:** {', '.join(updates['categories'])}\n")
-            f.write(f"**Work Items:** {len(updates['work_items'])}\n")
-            f.write(f"**Files Changed:** {len(updates['files_changed'])}\n")
-            f.write(f"**Features Added:** {len(updates['features_added'])}\n")
-            f.write(f"**Bugs Fixed:** {len(updates['bugs_fixed'])}\n\n")
-
-            if updates["work_items"]:
-                f.write("### Work Items Referenced\n")
-                for item in updates["work_items"]:
-                    f.write(f"- {item}\n")
-                f.write("\n")
-
-            if updates["files_changed"]:
-                f.write("### Files Changed\n")
-                for file in updates["files_changed"]:
-                    f.write(f"- {file}\n")
-                f.write("\n")
-
-            if updates["features_added"]:
-                f.write("### Features Added\n")
-                for feature in updates["features_added"]:
-                    f.write(f"- {feature}\n")
-                f.write("\n")
-
-            if updates["bugs_fixed"]:
-                f.write("### Bugs Fixed\n")
-                for bug in updates["bugs_fixed"]:
-                    f.write(f"- {bug}\n")
-                f.write("\n")
+        parts = [
+            SESSION_LOG_TEMPLATE.format_map(
+                {
+                    "project": self.config.project.name,
+                    "type": self.config.project.type,
+                    "timestamp": updates["timestamp"],
+                    "summary": session_summary,
+                    "categories": ", ".join(updates["categories"]),
+                    "work_item_count": len(updates["work_items"]),
+                    "file_count": len(updates["files_changed"]),
+                    "feature_count": len(updates["features_added"]),
+                    "bug_fix_count": len(updates["bugs_fixed"]),
+                }
+            )
+        ]
+
+        # Optional sections list each referenced item
+        for title, key in SESSION_LOG_SECTIONS:
+            if updates[key]:
+                parts.append(f"### {title}\n")
+                parts.extend(f"- {item}\n" for item in updates[key])
+                parts.append("\n")
+
+        log_file.write_text("".join(parts), encoding="utf-8")
 
         print(f"   📝 Session log created: {log_file}")
         return log_file
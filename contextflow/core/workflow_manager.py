@@ -3,13 +3,64 @@ ContextFlow Workflow Manager
 Manages workflow automation and validation
 """
 
+import errno
 import os
+import re
+import shutil
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from .config import ContextFlowConfig
 
+# Work item references: JIRA-style, GitHub-style, generic issue and task
+WORK_ITEM_PATTERN = re.compile(r"[A-Z]+-\d+|#\d+|issue-\d+|task-\d+", re.IGNORECASE)
+
+# Same matches on ASCII text, without the Unicode case folding and digit classes
+WORK_ITEM_ASCII_PATTERN = re.compile(WORK_ITEM_PATTERN.pattern, re.IGNORECASE | re.ASCII)
+
+# File references: filename.ext or a file under a common source directory
+FILE_REFERENCE_PATTERN = re.compile(r"\w+\.\w+|(?:src|lib|components|pages)/\w+")
+
+# Words that describe what was done in a session
+ACTION_WORDS = frozenset(
+    {
+        "implemented",
+        "added",
+        "created",
+        "built",
+        "developed",
+        "fixed",
+        "resolved",
+        "corrected",
+        "repaired",
+        "updated",
+        "modified",
+        "changed",
+        "improved",
+        "refactored",
+        "optimized",
+        "enhanced",
+        "tested",
+        "validated",
+        "verified",
+        "documented",
+        "wrote",
+        "drafted",
+    }
+)
+
+# Any action word as a whole word, found without lower-casing or tokenizing the summary
+ACTION_WORD_PATTERN = re.compile(
+    r"(?<![a-z])(?:" + "|".join(sorted(ACTION_WORDS)) + r")(?![a-z])", re.IGNORECASE
+)
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# Log directory scans are only cached once the directory has been unchanged this long
+LOG_SCAN_CACHE_MIN_AGE_NS = 2 * 10**9
+
 
 class WorkflowManager:
     """Manage workflow automation and validation"""
@@ -17,6 +68,9 @@ class WorkflowManager:
     def __init__(self, config: Optional[ContextFlowConfig] = None):
         self.config = config or ContextFlowConfig()
 
+        # Last session log scan as (log directory mtime_ns, entries)
+        self._log_scan_cache: Optional[Tuple[int, List[Tuple[str, float]]]] = None
+
     def validate_session_update(self, session_summary: str) -> Dict[str, Any]:
         """Validate session update against workflow requirements"""
         validation = {"valid": True, "warnings": [], "errors": [], "suggestions": []}
@@ -52,72 +106,21 @@ class WorkflowManager:
 
     def _has_work_item_references(self, text: str) -> bool:
         """Check if text contains work item references"""
-        import re
-
-        patterns = [
-            r"[A-Z]+-\d+",  # JIRA-style
-            r"#\d+",  # GitHub-style
-            r"issue-\d+",  # Generic issue
-            r"task-\d+",  # Generic task
-        ]
-
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-
-        return False
+        pattern = WORK_ITEM_ASCII_PATTERN if text.isascii() else WORK_ITEM_PATTERN
+        return pattern.search(text) is not None
 
     def _has_action_words(self, text: str) -> bool:
         """Check if text contains action words"""
-        action_words = [
-            "implemented",
-            "added",
-            "created",
-            "built",
-            "developed",
-            "fixed",
-            "resolved",
-            "corrected",
-            "repaired",
-            "updated",
-            "modified",
-            "changed",
-            "improved",
-            "refactored",
-            "optimized",
-            "enhanced",
-            "tested",
-            "validated",
-            "verified",
-            "documented",
-            "wrote",
-            "drafted",
-        ]
-
-        text_lower = text.lower()
-        return any(word in text_lower for word in action_words)
+        return ACTION_WORD_PATTERN.search(text) is not None
 
     def _has_file_references(self, text: str) -> bool:
         """Check if text contains file references"""
-        import re
-
-        # Look for file paths or extensions
-        file_patterns = [
-            r"\w+\.\w+",  # filename.ext
-            r"src/\w+",  # src/file
-            r"lib/\w+",  # lib/file
-            r"components/\w+",  # components/file
-            r"pages/\w+",  # pages/file
-        ]
-
-        for pattern in file_patterns:
-            if re.search(pattern, text):
-                return True
-
-        return False
+        return FILE_REFERENCE_PATTERN.search(text) is not None
 
     def get_workflow_status(self) -> Dict[str, Any]:
         """Get current workflow status and statistics"""
+        log_entries = self._scan_session_logs()
+        now_ts = time.time()
         status = {
             "configuration": {
                 "mandatory_updates": self.config.workflow.mandatory_session_updates,
@@ -125,25 +128,64 @@ class WorkflowManager:
                 "auto_refresh": self.config.ai_context.auto_refresh,
                 "retention_days": self.config.workflow.session_log_retention_days,
             },
-            "session_statistics": self._get_session_statistics(),
-            "maintenance": self._get_maintenance_status(),
+            "session_statistics": self._get_session_statistics(log_entries, now_ts),
+            "maintenance": self._get_maintenance_status(log_entries, now_ts),
         }
 
         return status
 
-    def _get_session_statistics(self) -> Dict[str, Any]:
-        """Get session statistics"""
-        log_dir = self.config.get_session_log_directory()
+    def get_session_statistics(self) -> Dict[str, Any]:
+        """Get session statistics without setting up any integrations"""
+        return self._get_session_statistics()
 
-        if not log_dir.exists():
-            return {
-                "total_sessions": 0,
-                "recent_sessions": 0,
-                "avg_sessions_per_week": 0,
-                "last_session": None,
-            }
+    def _scan_session_logs(self) -> List[Tuple[str, float]]:
+        """List session logs as (name, mtime) pairs with a single directory scan"""
+        log_dir = self.config.get_session_log_directory()
 
-        log_files = list(log_dir.glob("session_*.md"))
+        try:
+            # Adding, removing or renaming a log bumps the directory mtime
+            dir_mtime_ns = os.stat(log_dir).st_mtime_ns
+            if self._log_scan_cache and self._log_scan_cache[0] == dir_mtime_ns:
+                return self._log_scan_cache[1]
+
+            with os.scandir(log_dir) as it:
+                entries = [
+                    (entry.name, entry.stat().st_mtime)
+                    for entry in it
+                    if entry.name.startswith("session_")
+                    and entry.name.endswith(".md")
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+
+        # A directory changed within the timestamp granularity could change again unnoticed
+        if time.time_ns() - dir_mtime_ns > LOG_SCAN_CACHE_MIN_AGE_NS:
+            self._log_scan_cache = (dir_mtime_ns, entries)
+        return entries
+
+    def _iter_old_logs(
+        self,
+        log_entries: Optional[List[Tuple[str, float]]] = None,
+        now_ts: Optional[float] = None,
+    ) -> Iterator[str]:
+        """Yield the names of session logs older than the retention period"""
+        if log_entries is None:
+            log_entries = self._scan_session_logs()
+        if now_ts is None:
+            now_ts = time.time()
+
+        retention_days = self.config.workflow.session_log_retention_days
+        retention_cutoff = now_ts - retention_days * SECONDS_PER_DAY
+        return (name for name, mtime in log_entries if mtime < retention_cutoff)
+
+    def _get_session_statistics(
+        self,
+        log_entries: Optional[List[Tuple[str, float]]] = None,
+        now_ts: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Get session statistics"""
+        log_files = self._scan_session_logs() if log_entries is None else log_entries
 
         if not log_files:
             return {
@@ -153,24 +195,26 @@ class WorkflowManager:
                 "last_session": None,
             }
 
-        # Sort by modification time
-        log_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
-
-        # Count recent sessions (last 30 days)
-        recent_cutoff = datetime.now().timestamp() - (30 * 24 * 60 * 60)
-        recent_sessions = sum(1 for f in log_files if f.stat().st_mtime > recent_cutoff)
+        if now_ts is None:
+            now_ts = time.time()
+        recent_cutoff = now_ts - 30 * SECONDS_PER_DAY
+        week_cutoff = now_ts - 8 * 7 * SECONDS_PER_DAY
+
+        # Count recent (last 30 days) and weekly (last 8 weeks) sessions in one pass; for
+        # thousands of logs this loop is well under a millisecond, far below the directory scan
+        recent_sessions = 0
+        weekly_sessions = 0
+        last_mtime = log_files[0][1]
+        for _, mtime in log_files:
+            if mtime > recent_cutoff:
+                recent_sessions += 1
+            if mtime > week_cutoff:
+                weekly_sessions += 1
+            if mtime > last_mtime:
+                last_mtime = mtime
 
-        # Calculate average sessions per week (last 8 weeks)
-        week_cutoff = datetime.now().timestamp() - (8 * 7 * 24 * 60 * 60)
-        weekly_sessions = sum(1 for f in log_files if f.stat().st_mtime > week_cutoff)
         avg_per_week = weekly_sessions / 8 if weekly_sessions > 0 else 0
-
-        # Get last session date
-        last_session = None
-        if log_files:
-            last_session = datetime.fromtimestamp(log_files[0].stat().st_mtime).strftime(
-                "%Y-%m-%d %H:%M"
-            )
+        last_session = datetime.fromtimestamp(last_mtime).strftime("%Y-%m-%d %H:%M")
 
         return {
             "total_sessions": len(log_files),
@@ -179,9 +223,14 @@ class WorkflowManager:
             "last_session": last_session,
         }
 
-    def _get_maintenance_status(self) -> Dict[str, Any]:
+    def _get_maintenance_status(
+        self,
+        log_entries: Optional[List[Tuple[str, float]]] = None,
+        now_ts: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """Get maintenance status"""
-        log_dir = self.config.get_session_log_directory()
+        if now_ts is None:
+            now_ts = time.time()
         context_dir = self.config.get_context_directory()
 
         maintenance = {
@@ -192,22 +241,16 @@ class WorkflowManager:
         }
 
         # Check if log cleanup is needed
-        if log_dir.exists():
-            retention_cutoff = datetime.now().timestamp() - (
-                self.config.workflow.session_log_retention_days * 24 * 60 * 60
-            )
-            old_logs = [
-                f for f in log_dir.glob("session_*.md") if f.stat().st_mtime < retention_cutoff
-            ]
+        old_logs_count = sum(1 for _ in self._iter_old_logs(log_entries, now_ts))
 
-            maintenance["old_logs_count"] = len(old_logs)
-            maintenance["log_cleanup_needed"] = len(old_logs) > 0
+        maintenance["old_logs_count"] = old_logs_count
+        maintenance["log_cleanup_needed"] = old_logs_count > 0
 
         # Check if context refresh is needed
         quick_context_file = context_dir / self.config.ai_context.quick_context_file
         if quick_context_file.exists():
-            context_age = datetime.now().timestamp() - quick_context_file.stat().st_mtime
-            context_age_days = context_age / (24 * 60 * 60)
+            context_age = now_ts - quick_context_file.stat().st_mtime
+            context_age_days = context_age / SECONDS_PER_DAY
 
             maintenance["context_age_days"] = round(context_age_days, 1)
             maintenance["context_refresh_needed"] = (
@@ -225,35 +268,61 @@ class WorkflowManager:
         if not log_dir.exists():
             return {"cleaned": 0, "archived": 0, "errors": []}
 
-        retention_cutoff = datetime.now().timestamp() - (
-            self.config.workflow.session_log_retention_days * 24 * 60 * 60
-        )
-        old_logs = [f for f in log_dir.glob("session_*.md") if f.stat().st_mtime < retention_cutoff]
+        now_ts = time.time()
+        old_logs = list(self._iter_old_logs(now_ts=now_ts))
 
         if not old_logs:
             return {"cleaned": 0, "archived": 0, "errors": []}
 
         # Create archive directory
-        archive_dir = log_dir / "archive" / datetime.now().strftime("%Y-%m")
+        archive_dir = log_dir / "archive" / datetime.fromtimestamp(now_ts).strftime("%Y-%m")
         archive_dir.mkdir(parents=True, exist_ok=True)
 
         cleaned = 0
         archived = 0
         errors = []
 
-        for log_file in old_logs:
+        # Rename and unlink relative to open directory handles so each path is not resolved again
+        log_fd = archive_fd = None
+        if os.rename in os.supports_dir_fd and os.unlink in os.supports_dir_fd:
             try:
-                if self.config.workflow.auto_archive_logs:
-                    # Move to archive
-                    archive_path = archive_dir / log_file.name
-                    log_file.rename(archive_path)
-                    archived += 1
-                else:
-                    # Delete permanently
-                    log_file.unlink()
-                    cleaned += 1
-            except Exception as e:
-                errors.append(f"Error processing {log_file.name}: {e}")
+                log_fd = os.open(log_dir, os.O_RDONLY | os.O_DIRECTORY)
+                archive_fd = os.open(archive_dir, os.O_RDONLY | os.O_DIRECTORY)
+            except OSError:
+                # Fall back to path-based moves, which report a bad archive per file
+                if log_fd is not None:
+                    os.close(log_fd)
+                log_fd = archive_fd = None
+
+        try:
+            for name in old_logs:
+                try:
+                    if self.config.workflow.auto_archive_logs:
+                        # Move to archive
+                        try:
+                            if log_fd is not None:
+                                os.rename(name, name, src_dir_fd=log_fd, dst_dir_fd=archive_fd)
+                            else:
+                                os.rename(log_dir / name, archive_dir / name)
+                        except OSError as e:
+                            # The archive may be a link to another filesystem
+                            if e.errno != errno.EXDEV:
+                                raise
+                            shutil.move(str(log_dir / name), str(archive_dir / name))
+                        archived += 1
+                    else:
+                        # Delete permanently
+                        if log_fd is not None:
+                            os.unlink(name, dir_fd=log_fd)
+                        else:
+                            os.unlink(log_dir / name)
+                        cleaned += 1
+                except Exception as e:
+                    errors.append(f"Error processing {name}: {e}")
+        finally:
+            if log_fd is not None:
+                os.close(log_fd)
+                os.close(archive_fd)
 
         return {"cleaned": cleaned, "archived": archived, "errors": errors}
 
@@ -286,8 +355,10 @@ class WorkflowManager:
         """Get workflow improvement recommendations"""
         recommendations = []
 
-        stats = self._get_session_statistics()
-        maintenance = self._get_maintenance_status()
+        log_entries = self._scan_session_logs()
+        now_ts = time.time()
+        stats = self._get_session_statistics(log_entries, now_ts)
+        maintenance = self._get_maintenance_status(log_entries, now_ts)
 
         # Session frequency recommendations
         if stats["avg_sessions_per_week"] < 2:
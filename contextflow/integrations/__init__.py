@@ -3,12 +3,31 @@ ContextFlow Integrations
 Support for various platforms and tools
 """
 
-from .confluence import ConfluenceIntegration
-from .jira import JiraIntegration
-from .github import GitHubIntegration
+import importlib
+
+# Integrations are imported on first access so that enabling one does not pull in
+# the client libraries of all the others
+_LAZY_EXPORTS = {
+    "ConfluenceIntegration": ".confluence",
+    "JiraIntegration": ".jira",
+    "GitHubIntegration": ".github",
+}
 
 __all__ = [
     "ConfluenceIntegration",
     "JiraIntegration",
     "GitHubIntegration",
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,11 +2,18 @@
 ContextFlow Confluence Integration
 """
 
-import requests
+from html import escape
 from requests.auth import HTTPBasicAuth
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Optional
 from datetime import datetime
 
+from .http_session import create_session, parse_json
+
+
+def _cql_string(value: str) -> str:
+    """Quote a value for use in a CQL query"""
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
 
 class ConfluenceIntegration:
     """Confluence integration for ContextFlow with secure credential handling"""
@@ -33,49 +40,73 @@ class ConfluenceIntegration:
             self.auth = None
             print("Confluence credentials not configured. Run: contextflow setup confluence")
 
-    def update_from_session(self, session_updates: Dict[str, Any]):
+        self._session = create_session(auth=self.auth)
+
+        # Session updates page ID, looked up once per process
+        self._session_page_id: Optional[str] = None
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
+
+    def update_from_session(
+        self, session_updates: Dict[str, Any], log: Callable[[str], None] = print
+    ):
         """Update Confluence based on session updates"""
         if not self.auth:
-            print("   ⚠️  Confluence: No authentication configured")
+            log("   ⚠️  Confluence: No authentication configured")
             return
 
         try:
             # Find or create session updates page
-            page_id = self._find_or_create_session_page()
+            page_id = self._find_or_create_session_page(log)
 
             if page_id:
-                self._add_session_update(page_id, session_updates)
-                print("   ✅ Confluence updated with session information")
+                if self._add_session_update(page_id, session_updates, log):
+                    log("   ✅ Confluence updated with session information")
+                else:
+                    # The page may have been moved or deleted; look it up again next time
+                    self._session_page_id = None
+                    log("   ❌ Confluence: Could not add session update")
             else:
-                print("   ❌ Confluence: Could not find or create session page")
+                log("   ❌ Confluence: Could not find or create session page")
 
         except Exception as e:
-            print(f"   ❌ Confluence update failed: {e}")
+            log(f"   ❌ Confluence update failed: {e}")
 
-    def _find_or_create_session_page(self) -> Optional[str]:
+    def _find_or_create_session_page(self, log: Callable[[str], None] = print) -> Optional[str]:
         """Find or create a page for session updates"""
+        if self._session_page_id:
+            return self._session_page_id
+
         page_title = "ContextFlow Session Updates"
 
-        # Try to find existing page
+        # Try to find existing page; a CQL search returns only the page summary
         try:
-            url = f"{self.base_url}/wiki/rest/api/content"
-            params = {"spaceKey": self.space_key, "title": page_title, "type": "page"}
+            url = f"{self.base_url}/wiki/rest/api/content/search"
+            cql = (
+                f"space={_cql_string(self.space_key)} "
+                f"AND title={_cql_string(page_title)} AND type=page"
+            )
+            params = {"cql": cql, "limit": 1}
 
-            response = requests.get(url, params=params, auth=self.auth)
+            response = self._session.get(url, params=params)
 
+            page_id = None
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 if data["results"]:
-                    return data["results"][0]["id"]
+                    page_id = data["results"][0]["id"]
 
             # Create new page if not found
-            return self._create_session_page(page_title)
+            self._session_page_id = page_id or self._create_session_page(page_title, log)
+            return self._session_page_id
 
         except Exception as e:
-            print(f"   ❌ Error finding Confluence page: {e}")
+            log(f"   ❌ Error finding Confluence page: {e}")
             return None
 
-    def _create_session_page(self, title: str) -> Optional[str]:
+    def _create_session_page(self, title: str, log: Callable[[str], None] = print) -> Optional[str]:
         """Create a new session updates page"""
         try:
             url = f"{self.base_url}/wiki/rest/api/content"
@@ -97,38 +128,43 @@ class ConfluenceIntegration:
                 },
             }
 
-            response = requests.post(url, json=page_data, auth=self.auth)
+            response = self._session.post(url, json=page_data)
 
             if response.status_code == 200:
-                page_info = response.json()
+                page_info = parse_json(response)
                 return page_info["id"]
             else:
-                print(f"   ❌ Failed to create Confluence page: {response.status_code}")
+                log(f"   ❌ Failed to create Confluence page: {response.status_code}")
                 return None
 
         except Exception as e:
-            print(f"   ❌ Error creating Confluence page: {e}")
+            log(f"   ❌ Error creating Confluence page: {e}")
             return None
 
-    def _add_session_update(self, page_id: str, session_updates: Dict[str, Any]):
+    def _add_session_update(
+        self, page_id: str, session_updates: Dict[str, Any], log: Callable[[str], None] = print
+    ):
         """Add session update to existing page"""
         try:
             # Get current page content
             url = f"{self.base_url}/wiki/rest/api/content/{page_id}"
             params = {"expand": "body.storage,version"}
 
-            response = requests.get(url, params=params, auth=self.auth)
+            response = self._session.get(url, params=params)
 
             if response.status_code == 200:
-                page_data = response.json()
+                page_data = parse_json(response)
                 current_content = page_data["body"]["storage"]["value"]
                 current_version = page_data["version"]["number"]
 
                 # Create session update content
                 update_content = self._format_session_update(session_updates)
 
-                # Prepend new update to existing content
-                new_content = current_content.replace("<hr/>", f"{update_content}<hr/>")
+                # Prepend new update before the first divider (or append if there is none)
+                divider = current_content.find("<hr/>")
+                if divider == -1:
+                    divider = len(current_content)
+                new_content = current_content[:divider] + update_content + current_content[divider:]
 
                 # Update the page
                 update_data = {
@@ -138,13 +174,13 @@ class ConfluenceIntegration:
                     "body": {"storage": {"value": new_content, "representation": "storage"}},
                 }
 
-                update_response = requests.put(url, json=update_data, auth=self.auth)
+                update_response = self._session.put(url, json=update_data)
                 return update_response.status_code == 200
 
             return False
 
         except Exception as e:
-            print(f"   ❌ Error updating Confluence page: {e}")
+            log(f"   ❌ Error updating Confluence page: {e}")
             return False
 
     def _format_session_update(self, session_updates: Dict[str, Any]) -> str:
@@ -155,29 +191,32 @@ class ConfluenceIntegration:
         work_items = session_updates.get("work_items", [])
         files_changed = session_updates.get("files_changed", [])
 
-        content = f"""
+        parts = [
+            f"""
 <h2>🔄 Session Update - {datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M')}</h2>
-<p><strong>Summary:</strong> {summary}</p>
+<p><strong>Summary:</strong> {escape(summary)}</p>
 """
+        ]
 
         if categories:
-            content += f"<p><strong>Categories:</strong> {', '.join(categories)}</p>"
+            parts.append(f"<p><strong>Categories:</strong> {escape(', '.join(categories))}</p>")
 
         if work_items:
-            content += "<p><strong>Work Items:</strong></p><ul>"
-            for item in work_items:
-                content += f"<li>{item}</li>"
-            content += "</ul>"
+            parts.append("<p><strong>Work Items:</strong></p><ul>")
+            parts.extend(f"<li>{escape(item)}</li>" for item in work_items)
+            parts.append("</ul>")
 
         if files_changed:
-            content += "<p><strong>Files Changed:</strong></p><ul>"
-            for file in files_changed[:10]:  # Limit to first 10 files
-                content += f"<li><code>{file}</code></li>"
-            content += "</ul>"
+            parts.append("<p><strong>Files Changed:</strong></p><ul>")
+            # Limit to first 10 files
+            parts.extend(f"<li><code>{escape(file)}</code></li>" for file in files_changed[:10])
+            parts.append("</ul>")
 
-        content += f"<p><em>Updated by ContextFlow at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</em></p>"
+        parts.append(
+            f"<p><em>Updated by ContextFlow at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</em></p>"
+        )
 
-        return content
+        return "".join(parts)
 
     def extract_project_context(self) -> Dict[str, Any]:
         """Extract project context from Confluence"""
@@ -189,10 +228,10 @@ class ConfluenceIntegration:
             url = f"{self.base_url}/wiki/rest/api/content"
             params = {"spaceKey": self.space_key, "type": "page", "limit": 10}
 
-            response = requests.get(url, params=params, auth=self.auth)
+            response = self._session.get(url, params=params)
 
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json(response)
                 pages = []
 
                 for page in data["results"]:
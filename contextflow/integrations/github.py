@@ -2,10 +2,41 @@
 ContextFlow GitHub Integration
 """
 
-import requests
-from typing import Dict, Any, Optional, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from datetime import datetime
 
+from .http_session import create_session, parse_json
+
+# GitHub issue work items: #123, 123 or issue-123
+GITHUB_ISSUE_PATTERN = re.compile(r"^(?:#?(\d+)|issue-(\d+))$")
+
+# Maximum number of issue comments posted concurrently
+GITHUB_COMMENT_WORKERS = 8
+
+GITHUB_GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Repository info, open issues and recent commits in one request, limited to the fields we use
+PROJECT_CONTEXT_QUERY = """
+query($owner: String!, $name: String!, $limit: Int!) {
+  repository(owner: $owner, name: $name) {
+    description
+    primaryLanguage { name }
+    issues(first: $limit, states: OPEN, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      nodes { number title state updatedAt url assignees(first: 1) { nodes { login } } }
+    }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: $limit) { nodes { oid messageHeadline url author { name date } } }
+        }
+      }
+    }
+  }
+}
+"""
+
 
 class GitHubIntegration:
     """GitHub integration for ContextFlow with secure credential handling"""
@@ -32,72 +63,91 @@ class GitHubIntegration:
             self.headers = {}
             print("GitHub token not configured. Run: contextflow setup github")
 
-    def update_from_session(self, session_updates: Dict[str, Any]):
+        self._session = create_session(headers=self.headers)
+
+        # GET responses by (url, params) as (etag, data) for conditional requests
+        self._etag_cache: Dict[Tuple[str, Tuple], Tuple[str, Any]] = {}
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
+
+    def update_from_session(
+        self, session_updates: Dict[str, Any], log: Callable[[str], None] = print
+    ):
         """Update GitHub based on session updates"""
         if not self.token:
-            print("   ⚠️  GitHub: No token configured")
+            log("   ⚠️  GitHub: No token configured")
             return
 
         work_items = session_updates.get("work_items", [])
 
         if not work_items:
-            print("   ℹ️  GitHub: No work items to update")
+            log("   ℹ️  GitHub: No work items to update")
             return
 
         try:
-            for work_item in work_items:
-                if self._is_github_issue(work_item):
-                    issue_number = self._extract_issue_number(work_item)
-                    if issue_number:
-                        self._add_session_comment(issue_number, session_updates)
+            issue_numbers = [
+                issue_number
+                for issue_number in map(self._extract_issue_number, work_items)
+                if issue_number
+            ]
+
+            # Every issue gets the same comment, and the posts are independent
+            if issue_numbers:
+                comment_data = {"body": self._format_session_comment(session_updates)}
+                workers = min(GITHUB_COMMENT_WORKERS, len(issue_numbers))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(
+                        executor.map(
+                            lambda issue_number: self._add_session_comment(
+                                issue_number, comment_data, log=log
+                            ),
+                            issue_numbers,
+                        )
+                    )
 
-            print(f"   ✅ GitHub updated for relevant work items")
+            log(f"   ✅ GitHub updated for relevant work items")
 
         except Exception as e:
-            print(f"   ❌ GitHub update failed: {e}")
+            log(f"   ❌ GitHub update failed: {e}")
+
+    def _match_github_issue(self, work_item: str) -> Optional[re.Match]:
+        """Match work item against the GitHub issue formats"""
+        # Most work items (e.g. PROJ-123) are rejected by their first character without the regex
+        first = work_item[:1]
+        if first != "#" and not first.isdigit() and not work_item.startswith("issue-"):
+            return None
+        return GITHUB_ISSUE_PATTERN.match(work_item)
 
     def _is_github_issue(self, work_item: str) -> bool:
         """Check if work item is a GitHub issue format"""
-        import re
-
-        # Match patterns like #123, issue-456, etc.
-        return bool(re.match(r"^#?\d+$", work_item) or re.match(r"^issue-\d+$", work_item))
+        return self._match_github_issue(work_item) is not None
 
     def _extract_issue_number(self, work_item: str) -> Optional[int]:
         """Extract issue number from work item"""
-        import re
-
-        # Handle #123 format
-        match = re.match(r"^#?(\d+)$", work_item)
-        if match:
-            return int(match.group(1))
-
-        # Handle issue-123 format
-        match = re.match(r"^issue-(\d+)$", work_item)
+        match = self._match_github_issue(work_item)
         if match:
-            return int(match.group(1))
+            return int(match.group(1) or match.group(2))
 
         return None
 
-    def _add_session_comment(self, issue_number: int, session_updates: Dict[str, Any]):
+    def _add_session_comment(
+        self, issue_number: int, comment_data: Dict[str, Any], log: Callable[[str], None] = print
+    ):
         """Add session comment to GitHub issue"""
         try:
             url = f"https://api.github.com/repos/{self.repository}/issues/{issue_number}/comments"
 
-            # Format comment content
-            comment_body = self._format_session_comment(session_updates)
-
-            comment_data = {"body": comment_body}
-
-            response = requests.post(url, json=comment_data, headers=self.headers)
+            response = self._session.post(url, json=comment_data)
 
             if response.status_code == 201:
-                print(f"   ✅ Comment added to issue #{issue_number}")
+                log(f"   ✅ Comment added to issue #{issue_number}")
             else:
-                print(f"   ❌ Failed to comment on issue #{issue_number}: {response.status_code}")
+                log(f"   ❌ Failed to comment on issue #{issue_number}: {response.status_code}")
 
         except Exception as e:
-            print(f"   ❌ Error commenting on issue #{issue_number}: {e}")
+            log(f"   ❌ Error commenting on issue #{issue_number}: {e}")
 
     def _format_session_comment(self, session_updates: Dict[str, Any]) -> str:
         """Format session updates for GitHub comment"""
@@ -106,24 +156,46 @@ class GitHubIntegration:
         files_changed = session_updates.get("files_changed", [])
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
 
-        comment = f"## 🤖 ContextFlow Session Update - {timestamp}\n\n"
-        comment += f"**Summary:** {summary}\n\n"
+        parts = [
+            f"## 🤖 ContextFlow Session Update - {timestamp}\n\n",
+            f"**Summary:** {summary}\n\n",
+        ]
 
         if categories:
-            comment += f"**Categories:** {', '.join(categories)}\n\n"
+            parts.append(f"**Categories:** {', '.join(categories)}\n\n")
 
         if files_changed:
-            comment += f"**Files Modified:** {len(files_changed)} files\n"
+            parts.append(f"**Files Modified:** {len(files_changed)} files\n")
             if len(files_changed) <= 10:
-                comment += "```\n"
-                for file in files_changed:
-                    comment += f"- {file}\n"
-                comment += "```\n"
-            comment += "\n"
+                parts.append("```\n")
+                parts.extend(f"- {file}\n" for file in files_changed)
+                parts.append("```\n")
+            parts.append("\n")
+
+        parts.append("---\n*Updated via ContextFlow automation*")
+
+        return "".join(parts)
 
-        comment += "---\n*Updated via ContextFlow automation*"
+    def _cached_get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Optional[Any]:
+        """GET a JSON resource, revalidating cached responses with their ETag"""
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else None
 
-        return comment
+        response = self._session.get(url, params=params, headers=headers)
+
+        # Not modified: 304 responses carry no body and do not count against the rate limit
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        if response.status_code == 200:
+            data = parse_json(response)
+            etag = response.headers.get("ETag")
+            if etag:
+                self._etag_cache[key] = (etag, data)
+            return data
+
+        return None
 
     def get_repository_issues(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent issues from the repository"""
@@ -135,10 +207,9 @@ class GitHubIntegration:
 
             params = {"state": "open", "sort": "updated", "direction": "desc", "per_page": limit}
 
-            response = requests.get(url, params=params, headers=self.headers)
+            issues_data = self._cached_get(url, params)
 
-            if response.status_code == 200:
-                issues_data = response.json()
+            if issues_data is not None:
                 issues = []
 
                 for issue in issues_data:
@@ -175,10 +246,9 @@ class GitHubIntegration:
 
             params = {"per_page": limit}
 
-            response = requests.get(url, params=params, headers=self.headers)
+            commits_data = self._cached_get(url, params)
 
-            if response.status_code == 200:
-                commits_data = response.json()
+            if commits_data is not None:
                 commits = []
 
                 for commit in commits_data:
@@ -208,12 +278,20 @@ class GitHubIntegration:
             return {}
 
         try:
-            # Get repository info
-            repo_info = self._get_repository_info()
+            project_context = self._query_project_context(5)
 
-            # Get recent issues and commits
-            issues = self.get_repository_issues(5)
-            commits = self.get_recent_commits(5)
+            if project_context:
+                repo_info, issues, commits = project_context
+            else:
+                # Fall back to REST; the three requests are independent
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    repo_info_future = executor.submit(self._get_repository_info)
+                    issues_future = executor.submit(self.get_repository_issues, 5)
+                    commits_future = executor.submit(self.get_recent_commits, 5)
+
+                repo_info = repo_info_future.result()
+                issues = issues_future.result()
+                commits = commits_future.result()
 
             return {
                 "github_repository": {
@@ -230,17 +308,69 @@ class GitHubIntegration:
             print(f"   ⚠️  Error extracting GitHub context: {e}")
             return {}
 
+    def _query_project_context(self, limit: int) -> Optional[Tuple[Dict, List, List]]:
+        """Get repository info, recent issues and recent commits with a single GraphQL query"""
+        owner, _, name = self.repository.partition("/")
+        if not owner or not name:
+            return None
+
+        try:
+            variables = {"owner": owner, "name": name, "limit": limit}
+            response = self._session.post(
+                GITHUB_GRAPHQL_URL, json={"query": PROJECT_CONTEXT_QUERY, "variables": variables}
+            )
+            if response.status_code != 200:
+                return None
+
+            repository = (parse_json(response).get("data") or {}).get("repository")
+            if not repository:
+                return None
+
+            repo_info = {
+                "description": repository["description"],
+                "language": (repository["primaryLanguage"] or {}).get("name"),
+            }
+
+            issues = [
+                {
+                    "number": issue["number"],
+                    "title": issue["title"],
+                    "state": issue["state"].lower(),
+                    "assignee": issue["assignees"]["nodes"][0]["login"]
+                    if issue["assignees"]["nodes"]
+                    else "Unassigned",
+                    "updated_at": issue["updatedAt"],
+                    "url": issue["url"],
+                }
+                for issue in repository["issues"]["nodes"]
+            ]
+
+            # Empty repositories have no default branch
+            branch = repository["defaultBranchRef"]
+            history = branch["target"]["history"]["nodes"] if branch else []
+            commits = [
+                {
+                    "sha": commit["oid"][:7],
+                    "message": commit["messageHeadline"],
+                    "author": commit["author"]["name"],
+                    "date": commit["author"]["date"],
+                    "url": commit["url"],
+                }
+                for commit in history
+            ]
+
+            return repo_info, issues, commits
+
+        except Exception as e:
+            print(f"   ⚠️  Error querying GitHub GraphQL API: {e}")
+            return None
+
     def _get_repository_info(self) -> Dict[str, Any]:
         """Get repository information"""
         try:
             url = f"https://api.github.com/repos/{self.repository}"
 
-            response = requests.get(url, headers=self.headers)
-
-            if response.status_code == 200:
-                return response.json()
-
-            return {}
+            return self._cached_get(url) or {}
 
         except Exception as e:
             print(f"   ⚠️  Error getting repository info: {e}")
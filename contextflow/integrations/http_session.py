@@ -0,0 +1,62 @@
+"""
+ContextFlow HTTP session helpers for integrations
+"""
+
+import json
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson is an optional speedup for encoding and parsing API payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+HTTP_POOL_MAXSIZE = 10
+
+# Retry transient failures; POST is not retried so comments and pages are never duplicated
+HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 502, 503, 504],
+    raise_on_status=False,
+)
+
+# (connect, read) seconds, so a hung request cannot hold a pooled connection indefinitely
+HTTP_TIMEOUT = (5, 30)
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that applies a default timeout to requests sent without one"""
+
+    def send(self, request, timeout=None, **kwargs):
+        return super().send(request, timeout=HTTP_TIMEOUT if timeout is None else timeout, **kwargs)
+
+
+def create_session(auth=None, headers=None) -> requests.Session:
+    """Create a pooled requests session that keeps connections alive between API calls"""
+    session = requests.Session()
+    session.auth = auth
+    if headers:
+        session.headers.update(headers)
+
+    adapter = TimeoutHTTPAdapter(pool_maxsize=HTTP_POOL_MAXSIZE, max_retries=HTTP_RETRY)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def parse_json(response: requests.Response):
+    """Parse a JSON response body, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def dump_json(data) -> bytes:
+    """Encode a JSON request body, using orjson when it is available"""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
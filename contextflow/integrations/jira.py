@@ -2,11 +2,25 @@
 ContextFlow JIRA Integration
 """
 
-import requests
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
 from requests.auth import HTTPBasicAuth
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Callable, Optional, List, Tuple
 from datetime import datetime
 
+from .http_session import create_session, dump_json, parse_json
+
+# JIRA issue keys like PROJ-123, ABC-456, etc.
+JIRA_ISSUE_PATTERN = re.compile(r"^[A-Z]+-\d+$")
+
+# Maximum number of issue comments posted concurrently
+JIRA_COMMENT_WORKERS = 8
+
+# Seconds to reuse fetched project info and recent issues within one process
+JIRA_PROJECT_INFO_TTL = 300
+JIRA_ISSUES_TTL = 60
+
 
 class JiraIntegration:
     """JIRA integration for ContextFlow with secure credential handling"""
@@ -33,71 +47,103 @@ class JiraIntegration:
             self.auth = None
             print("JIRA credentials not configured. Run: contextflow setup jira")
 
-    def update_from_session(self, session_updates: Dict[str, Any]):
+        self._session = create_session(
+            auth=self.auth,
+            headers={"Accept": "application/json", "Content-Type": "application/json"},
+        )
+
+        # Fetched results by key as (monotonic time, value)
+        self._cache: Dict[Tuple, Tuple[float, Any]] = {}
+
+    def close(self):
+        """Close pooled HTTP connections"""
+        self._session.close()
+
+    def update_from_session(
+        self, session_updates: Dict[str, Any], log: Callable[[str], None] = print
+    ):
         """Update JIRA based on session updates"""
         if not self.auth:
-            print("   ⚠️  JIRA: No authentication configured")
+            log("   ⚠️  JIRA: No authentication configured")
             return
 
         work_items = session_updates.get("work_items", [])
 
         if not work_items:
-            print("   ℹ️  JIRA: No work items to update")
+            log("   ℹ️  JIRA: No work items to update")
             return
 
         try:
-            for work_item in work_items:
-                if self._is_jira_issue(work_item):
-                    self._add_session_comment(work_item, session_updates)
+            issue_keys = [
+                work_item for work_item in work_items if JIRA_ISSUE_PATTERN.match(work_item)
+            ]
+
+            # Every issue gets the same comment, encoded once, and the posts are independent
+            if issue_keys:
+                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+                comment_body = dump_json(self._build_comment_data(session_updates, timestamp))
+                workers = min(JIRA_COMMENT_WORKERS, len(issue_keys))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(
+                        executor.map(
+                            lambda issue_key: self._add_session_comment(
+                                issue_key, comment_body, log=log
+                            ),
+                            issue_keys,
+                        )
+                    )
 
-            print(f"   ✅ JIRA updated for {len(work_items)} work items")
+            log(f"   ✅ JIRA updated for {len(work_items)} work items")
 
         except Exception as e:
-            print(f"   ❌ JIRA update failed: {e}")
+            log(f"   ❌ JIRA update failed: {e}")
 
     def _is_jira_issue(self, work_item: str) -> bool:
         """Check if work item is a JIRA issue format"""
-        import re
-
-        # Match patterns like PROJ-123, ABC-456, etc.
-        return bool(re.match(r"^[A-Z]+-\d+$", work_item))
+        return JIRA_ISSUE_PATTERN.match(work_item) is not None
+
+    def _build_comment_data(
+        self, session_updates: Dict[str, Any], timestamp: str
+    ) -> Dict[str, Any]:
+        """Build the comment request body for session updates"""
+        # Format comment content
+        comment_body = self._format_session_comment(session_updates)
+
+        return {
+            "body": {
+                "type": "doc",
+                "version": 1,
+                "content": [
+                    {
+                        "type": "paragraph",
+                        "content": [
+                            {
+                                "type": "text",
+                                "text": f"🤖 ContextFlow Session Update - {timestamp}",
+                            }
+                        ],
+                    },
+                    {"type": "paragraph", "content": [{"type": "text", "text": comment_body}]},
+                ],
+            }
+        }
 
-    def _add_session_comment(self, issue_key: str, session_updates: Dict[str, Any]):
-        """Add session comment to JIRA issue"""
+    def _add_session_comment(
+        self, issue_key: str, comment_body: bytes, log: Callable[[str], None] = print
+    ):
+        """Add an encoded session comment to JIRA issue"""
         try:
             url = f"{self.base_url}/rest/api/3/issue/{issue_key}/comment"
 
-            # Format comment content
-            comment_body = self._format_session_comment(session_updates)
-
-            comment_data = {
-                "body": {
-                    "type": "doc",
-                    "version": 1,
-                    "content": [
-                        {
-                            "type": "paragraph",
-                            "content": [
-                                {
-                                    "type": "text",
-                                    "text": f"🤖 ContextFlow Session Update - {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-                                }
-                            ],
-                        },
-                        {"type": "paragraph", "content": [{"type": "text", "text": comment_body}]},
-                    ],
-                }
-            }
-
-            response = requests.post(url, json=comment_data, auth=self.auth)
+            response = self._session.post(url, data=comment_body)
 
             if response.status_code == 201:
-                print(f"   ✅ Comment added to {issue_key}")
+                log(f"   ✅ Comment added to {issue_key}")
             else:
-                print(f"   ❌ Failed to comment on {issue_key}: {response.status_code}")
+                log(f"   ❌ Failed to comment on {issue_key}: {response.status_code}")
 
         except Exception as e:
-            print(f"   ❌ Error commenting on {issue_key}: {e}")
+            log(f"   ❌ Error commenting on {issue_key}: {e}")
 
     def _format_session_comment(self, session_updates: Dict[str, Any]) -> str:
         """Format session updates for JIRA comment"""
@@ -105,54 +151,78 @@ class JiraIntegration:
         categories = session_updates.get("categories", [])
         files_changed = session_updates.get("files_changed", [])
 
-        comment = f"Session Summary: {summary}"
+        parts = [f"Session Summary: {summary}"]
 
         if categories:
-            comment += f"\n\nCategories: {', '.join(categories)}"
+            parts.append(f"\n\nCategories: {', '.join(categories)}")
 
         if files_changed:
-            comment += f"\n\nFiles Modified: {len(files_changed)} files"
+            parts.append(f"\n\nFiles Modified: {len(files_changed)} files")
             if len(files_changed) <= 5:
-                comment += f" ({', '.join(files_changed)})"
+                parts.append(f" ({', '.join(files_changed)})")
+
+        parts.append("\n\n---\nUpdated via ContextFlow automation")
+
+        return "".join(parts)
 
-        comment += "\n\n---\nUpdated via ContextFlow automation"
+    def _cached(self, key: Tuple, ttl: float, fetch: Callable[[], Any]) -> Any:
+        """Return a fetched value, reusing it for ttl seconds"""
+        cached = self._cache.get(key)
+        if cached and time.monotonic() - cached[0] < ttl:
+            return cached[1]
 
-        return comment
+        value = fetch()
+        # Empty results are what the fetchers return on errors, so they are not kept
+        if value:
+            self._cache[key] = (time.monotonic(), value)
+        return value
 
     def get_project_issues(self, limit: int = 20) -> List[Dict[str, Any]]:
         """Get recent issues from the project"""
         if not self.auth:
             return []
 
+        return self._cached(
+            ("issues", limit), JIRA_ISSUES_TTL, lambda: self._fetch_project_issues(limit)
+        )
+
+    def _fetch_project_issues(self, limit: int) -> List[Dict[str, Any]]:
+        """Fetch recent issues from the project"""
         try:
-            url = f"{self.base_url}/rest/api/3/search"
+            url = f"{self.base_url}/rest/api/3/search/jql"
 
             jql = f"project = {self.project_key} ORDER BY updated DESC"
 
             params = {"jql": jql, "maxResults": limit, "fields": "summary,status,assignee,updated"}
 
-            response = requests.get(url, params=params, auth=self.auth)
-
-            if response.status_code == 200:
-                data = response.json()
-                issues = []
-
-                for issue in data["issues"]:
-                    issues.append(
-                        {
-                            "key": issue["key"],
-                            "summary": issue["fields"]["summary"],
-                            "status": issue["fields"]["status"]["name"],
-                            "assignee": issue["fields"]["assignee"]["displayName"]
-                            if issue["fields"]["assignee"]
-                            else "Unassigned",
-                            "updated": issue["fields"]["updated"],
-                        }
-                    )
-
-                return issues
-
-            return []
+            issues = []
+            while len(issues) < limit:
+                response = self._session.get(url, params=params)
+                if response.status_code != 200:
+                    break
+
+                data = parse_json(response)
+                issues.extend(
+                    {
+                        "key": issue["key"],
+                        "summary": (fields := issue["fields"])["summary"],
+                        "status": fields["status"]["name"],
+                        "assignee": fields["assignee"]["displayName"]
+                        if fields["assignee"]
+                        else "Unassigned",
+                        "updated": fields["updated"],
+                    }
+                    for issue in data["issues"]
+                )
+
+                # The search may return fewer issues per page than requested
+                next_page_token = data.get("nextPageToken")
+                if not next_page_token:
+                    break
+                params["nextPageToken"] = next_page_token
+                params["maxResults"] = limit - len(issues)
+
+            return issues[:limit]
 
         except Exception as e:
             print(f"   ⚠️  Error getting JIRA issues: {e}")
@@ -185,13 +255,17 @@ class JiraIntegration:
 
     def _get_project_info(self) -> Dict[str, Any]:
         """Get project information"""
+        return self._cached(("project_info",), JIRA_PROJECT_INFO_TTL, self._fetch_project_info)
+
+    def _fetch_project_info(self) -> Dict[str, Any]:
+        """Fetch project information"""
         try:
             url = f"{self.base_url}/rest/api/3/project/{self.project_key}"
 
-            response = requests.get(url, auth=self.auth)
+            response = self._session.get(url)
 
             if response.status_code == 200:
-                return response.json()
+                return parse_json(response)
 
             return {}
 
@@ -7,8 +7,10 @@ Simple script to run ContextFlow without PATH issues
 import sys
 import os
 
-# Add the contextflow directory to Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Add the contextflow directory to Python path (once, if the script is run repeatedly)
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
 
 from contextflow.cli import main
 
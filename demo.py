@@ -6,24 +6,43 @@ Demonstrates the core functionality of ContextFlow
 
 import os
 import sys
+import tempfile
+from functools import lru_cache
 from pathlib import Path
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
-# Add the contextflow package to the path
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the contextflow package to the path (once, if the demo is run repeatedly)
+PROJECT_DIR = str(Path(__file__).resolve().parent)
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
 
 from contextflow.core.config import ContextFlowConfig
 from contextflow.core.session_updater import SessionUpdater
 from contextflow.core.context_extractor import ContextExtractor
 from contextflow.templates.project_templates import ProjectTemplates
 
-console = Console()
+# rich is imported where it is used so that importing the demo stays cheap
+
+SECTION_SEPARATOR = "\n" + "=" * 60 + "\n"
+
+# Characters of the generated quick context shown in the demo
+QUICK_CONTEXT_PREVIEW_CHARS = 500
+
+
+@lru_cache(maxsize=1)
+def _console():
+    """Get the shared rich console, created on first use"""
+    from rich.console import Console
+
+    return Console()
 
 
 def demo_project_creation():
     """Demonstrate project creation from template"""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
+
     console.print(Panel.fit("ContextFlow Demo: Project Creation", style="bold blue"))
 
     # Create a demo project
@@ -54,6 +73,10 @@ def demo_project_creation():
 
 def demo_context_extraction(config):
     """Demonstrate AI context extraction"""
+    from rich.panel import Panel
+
+    console = _console()
+
     console.print(Panel.fit("🤖 ContextFlow Demo: AI Context Extraction", style="bold green"))
 
     extractor = ContextExtractor(config)
@@ -70,10 +93,16 @@ def demo_context_extraction(config):
 
         if quick_file.exists():
             console.print("\n📄 Generated Quick Context:")
-            content = quick_file.read_text(encoding="utf-8")
+            # Read one character past the preview to know whether to truncate
+            with quick_file.open(encoding="utf-8") as f:
+                content = f.read(QUICK_CONTEXT_PREVIEW_CHARS + 1)
             console.print(
                 Panel(
-                    content[:500] + "..." if len(content) > 500 else content,
+                    (
+                        content[:QUICK_CONTEXT_PREVIEW_CHARS] + "..."
+                        if len(content) > QUICK_CONTEXT_PREVIEW_CHARS
+                        else content
+                    ),
                     title="Quick AI Context",
                     border_style="green",
                 )
@@ -84,6 +113,10 @@ def demo_context_extraction(config):
 
 def demo_session_update(config):
     """Demonstrate session documentation update"""
+    from rich.panel import Panel
+
+    console = _console()
+
     console.print(
         Panel.fit("📝 ContextFlow Demo: Session Documentation Update", style="bold yellow")
     )
@@ -120,6 +153,11 @@ Added unit tests for authentication flow with 95% coverage.
 
 def demo_workflow_status(config):
     """Demonstrate workflow status and recommendations"""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
+
     console.print(Panel.fit("⚙️ ContextFlow Demo: Workflow Status", style="bold magenta"))
 
     from contextflow.core.workflow_manager import WorkflowManager
@@ -155,6 +193,11 @@ def demo_workflow_status(config):
 
 def demo_integration_status(config):
     """Demonstrate integration status"""
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _console()
+
     console.print(Panel.fit("🔗 ContextFlow Demo: Integration Status", style="bold cyan"))
 
     integrations_table = Table()
@@ -163,11 +206,11 @@ def demo_integration_status(config):
     integrations_table.add_column("Configuration", style="yellow")
 
     for integration in ["confluence", "jira", "github", "notion", "slack"]:
-        enabled = config.is_integration_enabled(integration)
+        int_config = config.get_integration_config(integration)
+        enabled = int_config.get("enabled", False)
         status = "✅ Enabled" if enabled else "❌ Disabled"
 
         if enabled:
-            int_config = config.get_integration_config(integration)
             config_info = f"{len(int_config)} settings configured"
         else:
             config_info = "Not configured"
@@ -179,6 +222,10 @@ def demo_integration_status(config):
 
 def main():
     """Run the complete ContextFlow demo"""
+    from rich.panel import Panel
+
+    console = _console()
+
     console.print(
         Panel.fit(
             "ContextFlow - AI Session Context & Workflow Automation\n"
@@ -188,59 +235,61 @@ def main():
         )
     )
 
-    try:
-        # Change to a temporary directory for demo
-        demo_dir = Path("/tmp/contextflow-demo")
-        demo_dir.mkdir(exist_ok=True)
+    # Run in a fresh temporary directory so earlier demo runs leave nothing behind
+    previous_cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="contextflow-demo-") as demo_dir:
         os.chdir(demo_dir)
+        try:
+            # Demo 1: Project Creation
+            config = demo_project_creation()
 
-        # Demo 1: Project Creation
-        config = demo_project_creation()
+            console.print(SECTION_SEPARATOR)
 
-        console.print("\n" + "=" * 60 + "\n")
+            # Demo 2: Context Extraction
+            demo_context_extraction(config)
 
-        # Demo 2: Context Extraction
-        demo_context_extraction(config)
+            console.print(SECTION_SEPARATOR)
 
-        console.print("\n" + "=" * 60 + "\n")
+            # Demo 3: Session Update
+            demo_session_update(config)
 
-        # Demo 3: Session Update
-        demo_session_update(config)
+            console.print(SECTION_SEPARATOR)
 
-        console.print("\n" + "=" * 60 + "\n")
+            # Demo 4: Workflow Status
+            demo_workflow_status(config)
 
-        # Demo 4: Workflow Status
-        demo_workflow_status(config)
+            console.print(SECTION_SEPARATOR)
 
-        console.print("\n" + "=" * 60 + "\n")
+            # Demo 5: Integration Status
+            demo_integration_status(config)
 
-        # Demo 5: Integration Status
-        demo_integration_status(config)
+            console.print(SECTION_SEPARATOR)
 
-        console.print("\n" + "=" * 60 + "\n")
-
-        # Final summary
-        console.print(
-            Panel.fit(
-                "🎉 ContextFlow Demo Complete!\n\n"
-                "Key Features Demonstrated:\n"
-                "✅ Project templates and initialization\n"
-                "✅ AI context extraction and formatting\n"
-                "✅ Session documentation automation\n"
-                "✅ Workflow management and validation\n"
-                "✅ Multi-platform integrations\n\n"
-                "Ready to transform your AI-assisted workflow!",
-                style="bold green",
-                title="Demo Summary",
+            # Final summary
+            console.print(
+                Panel.fit(
+                    "🎉 ContextFlow Demo Complete!\n\n"
+                    "Key Features Demonstrated:\n"
+                    "✅ Project templates and initialization\n"
+                    "✅ AI context extraction and formatting\n"
+                    "✅ Session documentation automation\n"
+                    "✅ Workflow management and validation\n"
+                    "✅ Multi-platform integrations\n\n"
+                    "Ready to transform your AI-assisted workflow!",
+                    style="bold green",
+                    title="Demo Summary",
+                )
             )
-        )
 
-        console.print(f"\n📁 Demo files created in: {demo_dir}")
-        console.print("🚀 Try ContextFlow in your own projects!")
+            console.print("\n🧹 The demo ran in a temporary directory and leaves no files behind")
+            console.print("🚀 Try ContextFlow in your own projects!")
+
+        except Exception as e:
+            console.print(f"❌ Demo failed: {e}")
+            sys.exit(1)
 
-    except Exception as e:
-        console.print(f"❌ Demo failed: {e}")
-        sys.exit(1)
+        finally:
+            os.chdir(previous_cwd)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,17 @@
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cache_home(tmp_path_factory):
+    # Keep the parsed config cache out of the developer's real ~/.cache
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path_factory.mktemp("cache")))
+        yield
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
+    """A temporary project directory used as the working directory"""
+    # pytest prunes the directory and restores the working directory after each test
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
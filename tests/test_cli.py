@@ -1,14 +1,15 @@
 import unittest
 import os
 import sys
-from unittest.mock import patch, MagicMock
-
-# Add the parent directory to the path to import contextflow
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import tempfile
+from contextlib import redirect_stdout
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
 
 try:
     from click.testing import CliRunner
-    from contextflow.cli import main
+    from contextflow.cli import entry, main, run_quick_context
 except ImportError:
     # Skip tests if dependencies not available
     import pytest
@@ -16,57 +17,185 @@ except ImportError:
     pytest.skip("contextflow dependencies not available", allow_module_level=True)
 
 
+class StubCredentialsConfig:
+    """Config stand-in for commands that only list stored credentials"""
+
+    def __init__(self, stored_credentials):
+        self.stored_credentials = stored_credentials
+
+    def list_stored_credentials(self):
+        return self.stored_credentials
+
+
 class TestCLI(unittest.TestCase):
-    def setUp(self):
-        self.runner = CliRunner()
+    @classmethod
+    def setUpClass(cls):
+        cls.runner = CliRunner()
+
+    def invoke(self, args):
+        """Invoke the CLI, letting unexpected exceptions fail the test with their traceback"""
+        return self.runner.invoke(main, args, standalone_mode=False, catch_exceptions=False)
 
     def test_main_help(self):
         """Test main command help"""
-        result = self.runner.invoke(main, ["--help"])
+        result = self.invoke(["--help"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("ContextFlow", result.output)
 
     def test_templates_command(self):
         """Test templates command"""
-        result = self.runner.invoke(main, ["templates"])
+        result = self.invoke(["templates"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("software-development", result.output)
         self.assertIn("side-project", result.output)
 
-    @patch("contextflow.cli.ContextFlowConfig")
-    def test_credentials_command_empty(self, mock_config):
+    def test_credentials_command_empty(self):
         """Test credentials command with no stored credentials"""
-        mock_instance = MagicMock()
-        mock_instance.list_stored_credentials.return_value = {}
-        mock_config.return_value = mock_instance
-
-        result = self.runner.invoke(main, ["credentials"])
+        with patch("contextflow.cli.ContextFlowConfig", lambda: StubCredentialsConfig({})):
+            result = self.invoke(["credentials"])
         self.assertEqual(result.exit_code, 0)
         self.assertIn("No credentials stored", result.output)
 
-    @patch("contextflow.cli.ContextFlowConfig")
-    def test_credentials_command_with_data(self, mock_config):
+    def test_credentials_command_with_data(self):
         """Test credentials command with stored credentials"""
-        mock_instance = MagicMock()
-        mock_instance.list_stored_credentials.return_value = {
-            "github": ["token"],
-            "jira": ["username", "api_token"],
-        }
-        mock_config.return_value = mock_instance
-
-        result = self.runner.invoke(main, ["credentials"])
+        stored = {"github": ["token"], "jira": ["username", "api_token"]}
+        with patch("contextflow.cli.ContextFlowConfig", lambda: StubCredentialsConfig(stored)):
+            result = self.invoke(["credentials"])
         self.assertEqual(result.exit_code, 0)
         # Check for case-insensitive match since Rich may capitalize
         output_lower = result.output.lower()
         self.assertIn("github", output_lower)
         self.assertIn("jira", output_lower)
 
+    def test_logs_command(self):
+        """Test logs command shows session summaries"""
+        old_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                os.mkdir("session-logs")
+                Path("session-logs/session_20250101_093000.md").write_text(
+                    "# ContextFlow Session Log\n\n"
+                    "## Session Summary\n\nFixed login bug PROJ-1\n\n"
+                    "## Parsed Updates\n\n",
+                    encoding="utf-8",
+                )
+                # A name without a timestamp is listed under its file name
+                Path("session-logs/session_notes.md").write_text(
+                    "## Session Summary\n\nPlanning notes\n\n", encoding="utf-8"
+                )
+
+                result = self.invoke(["logs"])
+            finally:
+                os.chdir(old_cwd)
+
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn("2025-01-01 09:30", result.output)
+            self.assertIn("Fixed login bug PROJ-1", result.output)
+            self.assertIn("session_notes.md", result.output)
+            self.assertIn("Planning notes", result.output)
+            self.assertNotIn("Error reading log", result.output)
+
+    def test_status_command(self):
+        """Test status command with and without session statistics"""
+        old_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                result = self.invoke(["status"])
+                no_stats_result = self.invoke(["status", "--no-stats"])
+            finally:
+                os.chdir(old_cwd)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("Session Statistics", result.output)
+        self.assertEqual(no_stats_result.exit_code, 0)
+        self.assertIn("Project Information", no_stats_result.output)
+        self.assertNotIn("Session Statistics", no_stats_result.output)
+
+    def test_status_command_with_config(self):
+        """Test status shows the settings from the project's config file"""
+        old_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                Path("contextflow.yaml").write_text(
+                    'project:\n  name: "Status Project"\n'
+                    "integrations:\n  github:\n    enabled: true\n"
+                    "workflow:\n  session_log_retention_days: 45\n",
+                    encoding="utf-8",
+                )
+                # The stats scan runs on a worker thread, so repeat to catch a parse race
+                results = [self.invoke(["status"]) for _ in range(20)]
+            finally:
+                os.chdir(old_cwd)
+
+        for result in results:
+            self.assertEqual(result.exit_code, 0)
+            self.assertIn("Status Project", result.output)
+            self.assertIn("Session Log Retention: 45 days", result.output)
+            self.assertIn("Session Statistics", result.output)
+
+    def test_quick_context_fast_path(self):
+        """Test the Click-free quick context path matches context --quick"""
+        old_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                os.mkdir("ai-context")
+                Path("ai-context/QUICK_CONTEXT.txt").write_text(
+                    "PROJECT: Fast Path\n", encoding="utf-8"
+                )
+
+                result = self.invoke(["context", "--quick"])
+                fast_output = StringIO()
+                with redirect_stdout(fast_output):
+                    run_quick_context()
+            finally:
+                os.chdir(old_cwd)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertIn("PROJECT: Fast Path", fast_output.getvalue())
+        self.assertEqual(fast_output.getvalue(), result.output)
+
+    def test_entry_dispatch(self):
+        """Test the console script entry answers context --quick without the Click group"""
+        with patch("contextflow.cli.run_quick_context") as mock_quick, patch(
+            "contextflow.cli.main"
+        ) as mock_main:
+            with patch.object(sys, "argv", ["contextflow", "context", "-q"]):
+                entry()
+            mock_quick.assert_called_once_with(raw=False)
+
+            with patch.object(sys, "argv", ["contextflow", "context", "--raw"]):
+                entry()
+            mock_quick.assert_called_with(raw=True)
+            mock_main.assert_not_called()
+
+            with patch.object(sys, "argv", ["contextflow", "status"]):
+                entry()
+            mock_main.assert_called_once_with()
+
+    def test_context_raw(self):
+        """Test context --raw prints the quick context file unchanged"""
+        old_cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            os.chdir(temp_dir)
+            try:
+                os.mkdir("ai-context")
+                Path("ai-context/QUICK_CONTEXT.txt").write_text(
+                    "PROJECT: Raw\nTYPE: minimal\n", encoding="utf-8"
+                )
+
+                result = self.invoke(["context", "--raw"])
+            finally:
+                os.chdir(old_cwd)
+
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(result.output, "PROJECT: Raw\nTYPE: minimal\n")
+
     def test_invalid_setup_integration(self):
         """Test setup command with invalid integration"""
-        result = self.runner.invoke(main, ["setup", "invalid"])
+        result = self.invoke(["setup", "invalid"])
         self.assertEqual(result.exit_code, 1)
         self.assertIn("Invalid integration", result.output)
-
-
-if __name__ == "__main__":
-    unittest.main()
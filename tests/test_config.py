@@ -1,38 +1,20 @@
 import unittest
-import tempfile
 import os
-import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
-# Add the parent directory to the path to import contextflow
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import pytest
 
 try:
     from contextflow.core.config import ContextFlowConfig
 except ImportError:
     # Skip tests if dependencies not available
-    import pytest
-
     pytest.skip("contextflow dependencies not available", allow_module_level=True)
 
-
-class TestContextFlowConfig(unittest.TestCase):
-    def setUp(self):
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = os.path.join(self.temp_dir, "contextflow.yaml")
-
-    def test_config_initialization(self):
-        """Test basic config initialization"""
-        config = ContextFlowConfig()
-        self.assertIsNotNone(config.project)
-        self.assertIsNotNone(config.integrations)
-        self.assertIsNotNone(config.ai_context)
-        self.assertIsNotNone(config.workflow)
-
-    def test_config_with_file(self):
-        """Test config loading from file"""
-        # Create a basic config file
-        config_content = """
+# A basic config file covering every section
+TEST_CONFIG_YAML = """
 project:
   name: "Test Project"
   description: "Test Description"
@@ -50,14 +32,225 @@ ai_context:
 workflow:
   mandatory_session_updates: true
 """
-        with open(self.config_file, "w") as f:
-            f.write(config_content)
+
+
+class TestContextFlowConfig(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path, monkeypatch):
+        # pytest creates and prunes the directory, so there is no per-test rmtree
+        self.temp_dir = str(tmp_path)
+        # Working directory changes are undone by pytest after each test
+        self.monkeypatch = monkeypatch
+        self.config_file = os.path.join(self.temp_dir, "contextflow.yaml")
+
+    def test_config_initialization(self):
+        """Test basic config initialization"""
+        config = ContextFlowConfig()
+        self.assertIsNotNone(config.project)
+        self.assertIsNotNone(config.integrations)
+        self.assertIsNotNone(config.ai_context)
+        self.assertIsNotNone(config.workflow)
+
+    def test_config_with_file(self):
+        """Test config loading from file"""
+        Path(self.config_file).write_text(TEST_CONFIG_YAML, encoding="utf-8")
 
         config = ContextFlowConfig(self.config_file)
         self.assertEqual(config.project.name, "Test Project")
         self.assertEqual(config.project.description, "Test Description")
         self.assertEqual(config.project.type, "software-development")
 
+    def test_config_partial_sections(self):
+        """Test missing keys keep defaults and unknown keys are ignored"""
+        Path(self.config_file).write_text(
+            "workflow:\n  session_log_retention_days: 30\n  unknown_setting: 1\n", encoding="utf-8"
+        )
+
+        config = ContextFlowConfig(self.config_file)
+        self.assertEqual(config.workflow.session_log_retention_days, 30)
+        self.assertTrue(config.workflow.mandatory_session_updates)
+        self.assertFalse(hasattr(config.workflow, "unknown_setting"))
+        self.assertEqual(config.project.name, "My Project")
+
+    def test_config_sections_loaded_lazily(self):
+        """Test the config file is parsed on first section access, not construction"""
+        Path(self.config_file).write_text('project:\n  name: "Lazy Project"\n', encoding="utf-8")
+
+        with patch.object(
+            ContextFlowConfig, "_read_config_data", autospec=True, return_value={}
+        ) as mock_read:
+            config = ContextFlowConfig(self.config_file)
+            mock_read.assert_not_called()
+
+            config.project
+            config.workflow
+            mock_read.assert_called_once()
+
+    def test_config_sections_built_once_across_threads(self):
+        """Test concurrent first accesses parse the file once and share each section"""
+        Path(self.config_file).write_text(TEST_CONFIG_YAML, encoding="utf-8")
+        config = ContextFlowConfig(self.config_file)
+        read_config_data = config._read_config_data
+
+        def slow_read():
+            # Widen the window in which an unguarded parse would be seen half done
+            time.sleep(0.05)
+            return read_config_data()
+
+        with patch.object(config, "_read_config_data", side_effect=slow_read) as mock_read:
+            # Different sections race on the shared parse, not just on one property
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                sections = list(
+                    executor.map(lambda name: getattr(config, name), ["project", "workflow"] * 4)
+                )
+
+        mock_read.assert_called_once()
+        self.assertTrue(all(section is config.project for section in sections[::2]))
+        self.assertTrue(all(section is config.workflow for section in sections[1::2]))
+        self.assertEqual(config.project.name, "Test Project")
+
+    def test_load_sections(self):
+        """Test load_sections builds every section up front"""
+        Path(self.config_file).write_text(TEST_CONFIG_YAML, encoding="utf-8")
+        config = ContextFlowConfig(self.config_file)
+
+        config.load_sections()
+        with patch.object(config, "_get_config_data") as mock_get:
+            self.assertEqual(config.project.name, "Test Project")
+            self.assertTrue(config.workflow.mandatory_session_updates)
+            self.assertTrue(config.is_integration_enabled("github"))
+            mock_get.assert_not_called()
+
+    def test_save_and_reload_config(self):
+        """Test saved config can be loaded back"""
+        config = ContextFlowConfig(self.config_file)
+        config.project.name = "Round Trip"
+        config.project.tags = ["a", "b"]
+        config.integrations.github = {"enabled": True, "repository": "test/repo"}
+        config.save_config(self.config_file)
+
+        reloaded = ContextFlowConfig(self.config_file)
+        self.assertEqual(reloaded.project.name, "Round Trip")
+        self.assertEqual(reloaded.project.tags, ["a", "b"])
+        self.assertTrue(reloaded.is_integration_enabled("github"))
+
+    def test_config_parse_cache(self):
+        """Test unchanged config files are served from a per-file parse cache"""
+        Path(self.config_file).write_text('project:\n  name: "Cached Project"\n', encoding="utf-8")
+        cache_dir = Path(self.temp_dir, "cache", "contextflow", "config_cache")
+
+        with patch.dict(os.environ, {"XDG_CACHE_HOME": os.path.join(self.temp_dir, "cache")}):
+            ContextFlowConfig(self.config_file).project
+
+            with patch("contextflow.core.config.yaml.load") as mock_load:
+                config = ContextFlowConfig(self.config_file)
+                self.assertEqual(config.project.name, "Cached Project")
+                mock_load.assert_not_called()
+
+            # Rewriting the file invalidates the cached parse and replaces its entry
+            Path(self.config_file).write_text(
+                'project:\n  name: "Changed Project Name"\n', encoding="utf-8"
+            )
+            config = ContextFlowConfig(self.config_file)
+            self.assertEqual(config.project.name, "Changed Project Name")
+            self.assertEqual(len(list(cache_dir.iterdir())), 1)
+
+            # The cache may hold plaintext tokens, so only the user can read it
+            if os.name == "posix":
+                self.assertEqual(cache_dir.stat().st_mode & 0o777, 0o700)
+                cache_file = next(cache_dir.iterdir())
+                self.assertEqual(cache_file.stat().st_mode & 0o777, 0o600)
+
+            # Another config file gets its own entry
+            other_file = os.path.join(self.temp_dir, "other.yaml")
+            Path(other_file).write_text('project:\n  name: "Other"\n', encoding="utf-8")
+            self.assertEqual(ContextFlowConfig(other_file).project.name, "Other")
+            self.assertEqual(len(list(cache_dir.iterdir())), 2)
+
+    def test_find_config_file_in_parent(self):
+        """Test config discovery from a subdirectory, including after removal"""
+        Path(self.config_file).write_text('project:\n  name: "Parent Project"\n', encoding="utf-8")
+        sub_dir = os.path.join(self.temp_dir, "src", "pkg")
+        os.makedirs(sub_dir)
+
+        self.monkeypatch.chdir(sub_dir)
+
+        self.assertEqual(ContextFlowConfig().config_path, self.config_file)
+        self.assertEqual(ContextFlowConfig().config_path, self.config_file)
+
+        os.remove(self.config_file)
+        self.assertNotEqual(ContextFlowConfig().config_path, self.config_file)
+
+    def _patch_keyring(self, store):
+        """Patch keyring with an in-memory store keyed by (service, key)"""
+        import keyring.errors
+
+        def delete_password(service, key):
+            if (service, key) not in store:
+                raise keyring.errors.PasswordDeleteError(key)
+            del store[(service, key)]
+
+        patches = [
+            patch("keyring.get_password", side_effect=lambda s, k: store.get((s, k))),
+            patch("keyring.set_password", side_effect=lambda s, k, v: store.update({(s, k): v})),
+            patch("keyring.delete_password", side_effect=delete_password),
+        ]
+        for keyring_patch in patches:
+            keyring_patch.start()
+            self.addCleanup(keyring_patch.stop)
+
+    def test_credentials_stored_per_integration(self):
+        """Test credentials are stored as one keyring entry per integration"""
+        store = {}
+        self._patch_keyring(store)
+
+        config = ContextFlowConfig()
+        config.set_credential("jira", "username", "me@example.com")
+        config.set_credential("jira", "api_token", "secret")
+
+        self.assertIn(("contextflow", "jira"), store)
+        self.assertEqual(config.get_credential("jira", "api_token"), "secret")
+        self.assertEqual(config.list_stored_credentials(), {"jira": ["username", "api_token"]})
+
+        config.remove_credentials("jira")
+        self.assertEqual(config.list_stored_credentials(), {})
+
+    def test_credentials_without_orjson(self):
+        """Test credential entries round-trip with the stdlib json fallback"""
+        store = {}
+        self._patch_keyring(store)
+
+        with patch("contextflow.core.config.orjson", None):
+            config = ContextFlowConfig()
+            config.set_credential("github", "token", "abc")
+            self.assertEqual(config.get_credential("github", "token"), "abc")
+
+    def test_setup_integration_credentials(self):
+        """Test interactive setup stores all answers in one keyring write"""
+        store = {}
+        self._patch_keyring(store)
+
+        config = ContextFlowConfig()
+        with patch("builtins.input", return_value="me@example.com"), patch(
+            "getpass.getpass", return_value="secret"
+        ), patch.object(config, "set_credentials", wraps=config.set_credentials) as mock_set:
+            config.setup_integration_credentials("jira")
+
+        mock_set.assert_called_once_with(
+            "jira", {"username": "me@example.com", "api_token": "secret"}
+        )
+        self.assertEqual(config.get_credential("jira", "username"), "me@example.com")
+
+    def test_legacy_credentials_migrated(self):
+        """Test per-field keyring entries are consolidated on first read"""
+        store = {("contextflow", "github_token"): "legacy-token"}
+        self._patch_keyring(store)
+
+        config = ContextFlowConfig()
+        self.assertEqual(config.get_integration_credentials("github"), {"token": "legacy-token"})
+        self.assertNotIn(("contextflow", "github_token"), store)
+        self.assertIn(("contextflow", "github"), store)
+
     def test_integration_enabled(self):
         """Test integration enabled check"""
         config = ContextFlowConfig()
@@ -82,22 +275,8 @@ workflow:
         config.workflow.session_log_directory = "test-logs"
 
         # Change to temp directory
-        old_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
-
-        try:
-            config.ensure_directories()
-            self.assertTrue(Path("test-context").exists())
-            self.assertTrue(Path("test-logs").exists())
-        finally:
-            os.chdir(old_cwd)
-
-    def tearDown(self):
-        # Clean up temp files
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
+        self.monkeypatch.chdir(self.temp_dir)
 
-if __name__ == "__main__":
-    unittest.main()
+        config.ensure_directories()
+        self.assertTrue(Path("test-context").exists())
+        self.assertTrue(Path("test-logs").exists())
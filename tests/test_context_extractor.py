@@ -0,0 +1,211 @@
+import unittest
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+try:
+    from contextflow.core.config import ContextFlowConfig
+    from contextflow.core.context_extractor import ContextExtractor, _read_session_log
+except ImportError:
+    # Skip tests if dependencies not available
+    pytest.skip("contextflow dependencies not available", allow_module_level=True)
+
+
+def write_session_log(log_dir, name, summary, work_items=(), age_days=0):
+    """Write a session log in the format produced by SessionUpdater"""
+    content = "# ContextFlow Session Log\n\n"
+    content += f"## Session Summary\n\n{summary}\n\n"
+    content += "## Parsed Updates\n\n"
+    if work_items:
+        content += "### Work Items Referenced\n"
+        content += "".join(f"- {item}\n" for item in work_items)
+        content += "\n"
+
+    path = os.path.join(log_dir, name)
+    Path(path).write_text(content, encoding="utf-8")
+
+    mtime = time.time() - age_days * 24 * 60 * 60
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestContextExtractor(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _project(self, project_dir):
+        self.temp_dir = str(project_dir)
+        self.config = ContextFlowConfig(os.path.join(self.temp_dir, "contextflow.yaml"))
+        self.extractor = ContextExtractor(self.config)
+        self.log_dir = str(self.config.get_session_log_directory())
+
+    def test_recent_changes(self):
+        """Test recent changes come from the newest logs within a week"""
+        write_session_log(self.log_dir, "session_20250101_090000.md", "Old work", age_days=10)
+        write_session_log(self.log_dir, "session_20250102_090000.md", "Older work", age_days=2)
+        write_session_log(self.log_dir, "session_20250103_090000.md", "Newest work", age_days=1)
+
+        changes = self.extractor._get_recent_changes()
+        self.assertEqual(changes, ["Recent: Newest work...", "Recent: Older work..."])
+
+    def test_recent_work_items(self):
+        """Test work items are collected from logs within two weeks"""
+        write_session_log(self.log_dir, "session_1.md", "A", ["PROJ-1", "#2"], age_days=3)
+        write_session_log(self.log_dir, "session_2.md", "B", ["PROJ-1"], age_days=10)
+        write_session_log(self.log_dir, "session_3.md", "C", ["PROJ-9"], age_days=30)
+        write_session_log(self.log_dir, "notes.md", "D", ["PROJ-7"])
+
+        work_items = self.extractor._get_recent_work_items()
+        self.assertEqual(sorted(work_items), ["#2", "PROJ-1"])
+
+    def test_unreadable_logs_skipped(self):
+        """Test logs that cannot be decoded are skipped"""
+        write_session_log(self.log_dir, "session_1.md", "Readable", ["PROJ-3"])
+        Path(self.log_dir, "session_2.md").write_bytes(b"\xff\xfe## Session Summary\n\n\xff\n\n")
+
+        self.assertEqual(self.extractor._get_recent_changes(), ["Recent: Readable..."])
+        self.assertEqual(self.extractor._get_recent_work_items(), ["PROJ-3"])
+
+    def test_crlf_logs(self):
+        """Test logs with Windows line endings are parsed like LF logs"""
+        Path(self.log_dir, "session_1.md").write_bytes(
+            b"## Session Summary\r\n\r\nFixed sync\r\nacross devices\r\n\r\n"
+            b"### Work Items Referenced\r\n- PROJ-8\r\n- #9\r\n\r\n"
+        )
+        open(os.path.join(self.log_dir, "session_2.md"), "w").close()
+
+        self.assertEqual(
+            self.extractor._get_recent_changes(), ["Recent: Fixed sync\nacross devices..."]
+        )
+        self.assertEqual(sorted(self.extractor._get_recent_work_items()), ["#9", "PROJ-8"])
+
+    def test_session_index_reused(self):
+        """Test unchanged logs are served from the session index on the next run"""
+        path = write_session_log(self.log_dir, "session_1.md", "Indexed work", ["PROJ-4"])
+        self.assertTrue(self.extractor.extract_and_generate_context())
+
+        index_file = self.config.get_context_directory() / ".session_index.json"
+        self.assertTrue(index_file.exists())
+
+        extractor = ContextExtractor(self.config)
+        with patch("contextflow.core.context_extractor._read_session_log") as mock_read:
+            self.assertEqual(extractor._get_recent_changes(), ["Recent: Indexed work..."])
+            self.assertEqual(extractor._get_recent_work_items(), ["PROJ-4"])
+            mock_read.assert_not_called()
+
+        # Modifying the log invalidates its index entry for the next extractor
+        write_session_log(self.log_dir, "session_1.md", "Changed work", ["PROJ-5"])
+        os.utime(path, ns=(time.time_ns() + 10**9,) * 2)
+        extractor = ContextExtractor(self.config)
+        self.assertEqual(extractor._get_recent_changes(), ["Recent: Changed work..."])
+
+    def test_session_index_malformed_records(self):
+        """Test malformed session index records are re-read instead of trusted"""
+        path = write_session_log(self.log_dir, "session_1.md", "Indexed work", ["PROJ-4"])
+        mtime_ns = os.stat(path).st_mtime_ns
+        index_file = self.config.get_context_directory() / ".session_index.json"
+
+        malformed = ["not a record", {"mtime_ns": mtime_ns}, {"mtime_ns": mtime_ns, "summary": 1}]
+        for record in malformed:
+            index_file.write_text(json.dumps({str(path): record}), encoding="utf-8")
+
+            extractor = ContextExtractor(self.config)
+            self.assertEqual(extractor._get_recent_changes(), ["Recent: Indexed work..."])
+            self.assertEqual(extractor._get_recent_work_items(), ["PROJ-4"])
+
+    def test_session_logs_listed_once(self):
+        """Test the session log directory is listed once per extractor"""
+        write_session_log(self.log_dir, "session_1.md", "First", ["PROJ-1"])
+
+        with patch("contextflow.core.context_extractor.os.scandir", wraps=os.scandir) as mock_scan:
+            self.extractor._get_recent_changes()
+            self.extractor._get_recent_work_items()
+        self.assertEqual(mock_scan.call_count, 1)
+
+    def test_logs_read_once_per_context(self):
+        """Test recent changes and work items share a single read of each log"""
+        write_session_log(self.log_dir, "session_1.md", "First", ["PROJ-1"], age_days=1)
+        write_session_log(self.log_dir, "session_2.md", "Second", ["PROJ-2"], age_days=10)
+
+        with patch(
+            "contextflow.core.context_extractor._read_session_log", wraps=_read_session_log
+        ) as mock_read:
+            context = self.extractor.gather_project_context()
+        self.assertEqual(mock_read.call_count, 2)
+        self.assertEqual(context["recent_changes"], ["Recent: First..."])
+        self.assertEqual(sorted(context["work_items"]), ["PROJ-1", "PROJ-2"])
+
+    def test_work_items_skipped_when_not_required(self):
+        """Test session logs are not scanned for work items when references are optional"""
+        self.config.workflow.require_work_item_references = False
+
+        write_session_log(self.log_dir, "session_1.md", "Recent", ["PROJ-1"], age_days=1)
+        write_session_log(self.log_dir, "session_2.md", "Older", ["PROJ-2"], age_days=10)
+
+        with patch(
+            "contextflow.core.context_extractor._read_session_log", wraps=_read_session_log
+        ) as mock_read:
+            context = self.extractor.gather_project_context()
+        mock_read.assert_called_once_with(os.path.join(self.log_dir, "session_1.md"))
+        self.assertEqual(context["recent_changes"], ["Recent: Recent..."])
+        self.assertEqual(context["work_items"], [])
+
+    def test_analyze_file_structure(self):
+        """Test key directories and config files are detected in the project root"""
+        os.makedirs("src")
+        open("tests", "w").close()  # A file, not a directory
+        for name in ["Makefile", "package.json", "README.md"]:
+            open(name, "w").close()
+
+        structure = self.extractor._analyze_file_structure()
+        self.assertIn("src", structure["key_directories"])
+        self.assertNotIn("tests", structure["key_directories"])
+        self.assertEqual(structure["config_files"], ["package.json", "Makefile"])
+        self.assertEqual(structure["documentation_files"], ["README.md"])
+
+    def test_find_documentation_files(self):
+        """Test READMEs and documentation directories are listed before other markdown"""
+        for path in ["README.md", "CHANGELOG.md", "docs/guide/setup.md", "docs/notes.txt"]:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            open(path, "w").close()
+        os.makedirs("src")
+        open("src/ignored.md", "w").close()
+
+        docs = self.extractor._find_documentation_files()
+        self.assertEqual(
+            docs, ["README.md", os.path.join("docs", "guide", "setup.md"), "CHANGELOG.md"]
+        )
+
+    def test_extract_and_generate_context(self):
+        """Test context files are generated"""
+        write_session_log(self.log_dir, "session_20250103_090000.md", "Added login", ["PROJ-5"])
+
+        self.assertTrue(self.extractor.extract_and_generate_context())
+
+        context_dir = self.config.get_context_directory()
+        quick_file = context_dir / self.config.ai_context.quick_context_file
+        full_file = context_dir / self.config.ai_context.full_context_file
+        quick_content = quick_file.read_text(encoding="utf-8")
+        full_content = full_file.read_text(encoding="utf-8")
+
+        self.assertIn(f"PROJECT: {self.config.project.name}", quick_content)
+        self.assertIn("- Recent: Added login...", quick_content)
+        self.assertIn("- PROJ-5", quick_content)
+        self.assertIn("## 🔄 Recent Changes", full_content)
+        self.assertTrue((context_dir / "HOW_TO_USE_CONTEXTFLOW.md").exists())
+
+    def test_context_files_replaced_atomically(self):
+        """Test a failed write keeps the previous context file and leaves no temp file"""
+        self.assertTrue(self.extractor.extract_and_generate_context())
+        context_dir = self.config.get_context_directory()
+        quick_file = context_dir / self.config.ai_context.quick_context_file
+        previous = quick_file.read_text(encoding="utf-8")
+
+        self.config.project.name = "Renamed Project"
+        with patch("contextflow.core.context_extractor.os.replace", side_effect=OSError):
+            self.assertFalse(self.extractor.extract_and_generate_context())
+
+        self.assertEqual(quick_file.read_text(encoding="utf-8"), previous)
+        self.assertEqual([path for path in os.listdir(context_dir) if path.endswith(".tmp")], [])
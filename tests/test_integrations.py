@@ -0,0 +1,384 @@
+import unittest
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+try:
+    from contextflow.integrations.confluence import ConfluenceIntegration
+    from contextflow.integrations.github import GitHubIntegration
+    from contextflow.integrations.http_session import HTTP_TIMEOUT, dump_json, parse_json
+    from contextflow.integrations.jira import JiraIntegration
+    import requests
+except ImportError:
+    # Skip tests if dependencies not available
+    import pytest
+
+    pytest.skip("contextflow dependencies not available", allow_module_level=True)
+
+
+class TestGitHubIntegration(unittest.TestCase):
+    def setUp(self):
+        self.github = GitHubIntegration({"repository": "test/repo", "token": "token"})
+
+    def test_issue_work_items(self):
+        """Test GitHub issue work items are recognized and numbered"""
+        for work_item, number in [("#12", 12), ("34", 34), ("issue-56", 56)]:
+            self.assertTrue(self.github._is_github_issue(work_item))
+            self.assertEqual(self.github._extract_issue_number(work_item), number)
+
+        for work_item in ["PROJ-1", "task-2", "#12a", "issue-", "", "#", "1-2"]:
+            self.assertFalse(self.github._is_github_issue(work_item))
+            self.assertIsNone(self.github._extract_issue_number(work_item))
+
+    def test_update_comments_on_each_issue(self):
+        """Test a session update posts one shared comment to every GitHub issue work item"""
+        updates = {"work_items": ["#1", "PROJ-2", "issue-3", "4"], "summary": "Fixed sync"}
+
+        with patch.object(self.github, "_add_session_comment") as mock_comment:
+            self.github.update_from_session(updates)
+
+        calls = sorted(call.args for call in mock_comment.call_args_list)
+        self.assertEqual([issue_number for issue_number, _ in calls], [1, 3, 4])
+        self.assertIs(calls[0][1], calls[2][1])
+        self.assertIn("**Summary:** Fixed sync", calls[0][1]["body"])
+
+    def test_extract_project_context_graphql(self):
+        """Test project context comes from a single GraphQL query"""
+        body = {
+            "data": {
+                "repository": {
+                    "description": "Sync tool",
+                    "primaryLanguage": {"name": "Python"},
+                    "issues": {
+                        "nodes": [
+                            {
+                                "number": 7,
+                                "title": "Crash on start",
+                                "state": "OPEN",
+                                "updatedAt": "2025-01-02T03:04:05Z",
+                                "url": "https://github.com/test/repo/issues/7",
+                                "assignees": {"nodes": []},
+                            }
+                        ]
+                    },
+                    "defaultBranchRef": {
+                        "target": {
+                            "history": {
+                                "nodes": [
+                                    {
+                                        "oid": "abc1234def",
+                                        "messageHeadline": "Fix crash",
+                                        "url": "https://github.com/test/repo/commit/abc1234def",
+                                        "author": {"name": "Dev", "date": "2025-01-02T03:04:05Z"},
+                                    }
+                                ]
+                            }
+                        }
+                    },
+                }
+            }
+        }
+        response = MagicMock(status_code=200, content=json.dumps(body).encode())
+        session = self.github._session
+
+        with patch.object(session, "post", return_value=response) as mock_post, patch.object(
+            session, "get"
+        ) as mock_get:
+            context = self.github.extract_project_context()
+
+        mock_get.assert_not_called()
+        self.assertEqual(
+            mock_post.call_args.kwargs["json"]["variables"],
+            {"owner": "test", "name": "repo", "limit": 5},
+        )
+        self.assertEqual(context["github_repository"]["language"], "Python")
+        self.assertEqual(context["recent_issues"][0]["state"], "open")
+        self.assertEqual(context["recent_issues"][0]["assignee"], "Unassigned")
+        self.assertEqual(context["recent_commits"][0]["sha"], "abc1234")
+        self.assertEqual(context["recent_commits"][0]["message"], "Fix crash")
+
+    def test_extract_project_context_rest_fallback(self):
+        """Test project context falls back to the REST endpoints"""
+        with patch.object(self.github, "_query_project_context", return_value=None), patch.object(
+            self.github, "_get_repository_info", return_value={"language": "Python"}
+        ), patch.object(
+            self.github, "get_repository_issues", return_value=[{"number": 1}]
+        ) as mock_issues, patch.object(
+            self.github, "get_recent_commits", return_value=[{"sha": "abc1234"}]
+        ):
+            context = self.github.extract_project_context()
+
+        mock_issues.assert_called_once_with(5)
+        self.assertEqual(context["github_repository"]["language"], "Python")
+        self.assertEqual(context["recent_issues"], [{"number": 1}])
+        self.assertEqual(context["recent_commits"], [{"sha": "abc1234"}])
+
+    def test_conditional_requests(self):
+        """Test repeated GETs send the cached ETag and reuse the body on 304"""
+        ok = MagicMock(status_code=200, headers={"ETag": '"v1"'}, content=b'{"language": "Python"}')
+        not_modified = MagicMock(status_code=304, headers={})
+
+        with patch.object(self.github._session, "get", side_effect=[ok, not_modified]) as mock_get:
+            self.assertEqual(self.github._get_repository_info(), {"language": "Python"})
+            self.assertEqual(self.github._get_repository_info(), {"language": "Python"})
+
+        self.assertIsNone(mock_get.call_args_list[0].kwargs["headers"])
+        self.assertEqual(mock_get.call_args_list[1].kwargs["headers"], {"If-None-Match": '"v1"'})
+
+    def test_requests_share_pooled_session(self):
+        """Test API calls reuse one authenticated session"""
+        session = self.github._session
+        self.assertEqual(session.headers["Authorization"], "token token")
+        self.assertIs(session.get_adapter("https://api.github.com"), session.adapters["https://"])
+        self.assertEqual(session.adapters["https://"].max_retries.total, 3)
+
+        with patch.object(session, "get", return_value=MagicMock(status_code=404)) as mock_get:
+            self.assertEqual(self.github.get_recent_commits(), [])
+            self.assertEqual(self.github._get_repository_info(), {})
+        self.assertEqual(mock_get.call_count, 2)
+
+
+class TestConfluenceIntegration(unittest.TestCase):
+    def setUp(self):
+        self.confluence = ConfluenceIntegration(
+            {
+                "base_url": "https://example.atlassian.net",
+                "space_key": "DEV",
+                "username": "user",
+                "api_token": "secret",
+            }
+        )
+
+    def test_session_page_looked_up_once(self):
+        """Test the session page is found with CQL once and its ID reused"""
+        found = MagicMock(status_code=200, content=b'{"results": [{"id": "42"}]}')
+
+        with patch.object(self.confluence._session, "get", return_value=found) as mock_get:
+            self.assertEqual(self.confluence._find_or_create_session_page(), "42")
+            self.assertEqual(self.confluence._find_or_create_session_page(), "42")
+
+        mock_get.assert_called_once_with(
+            "https://example.atlassian.net/wiki/rest/api/content/search",
+            params={
+                "cql": 'space="DEV" AND title="ContextFlow Session Updates" AND type=page',
+                "limit": 1,
+            },
+        )
+
+        # A failed update forgets the page so it is looked up again
+        messages = []
+        with patch.object(self.confluence, "_add_session_update", return_value=False):
+            self.confluence.update_from_session({}, log=messages.append)
+        self.assertIsNone(self.confluence._session_page_id)
+        self.assertEqual(messages, ["   ❌ Confluence: Could not add session update"])
+
+    def test_session_update_escapes_html(self):
+        """Test user-provided text is escaped in the Confluence storage format"""
+        content = self.confluence._format_session_update(
+            {
+                "timestamp": "2025-01-02T03:04:05",
+                "summary": "Fixed <script> & styles",
+                "work_items": ["PROJ-1"],
+                "files_changed": ["src/a<b>.py"],
+            }
+        )
+
+        self.assertIn("<h2>🔄 Session Update - 2025-01-02 03:04</h2>", content)
+        self.assertIn("<strong>Summary:</strong> Fixed &lt;script&gt; &amp; styles", content)
+        self.assertIn("<ul><li>PROJ-1</li></ul>", content)
+        self.assertIn("<li><code>src/a&lt;b&gt;.py</code></li>", content)
+
+    def test_session_update_inserted_once(self):
+        """Test a session update is added before the first divider only"""
+        page = MagicMock(
+            status_code=200,
+            content=b'{"title": "Updates", "version": {"number": 3}, '
+            b'"body": {"storage": {"value": "<h1>Log</h1><hr/><h2>Old</h2><hr/>"}}}',
+        )
+        session = self.confluence._session
+
+        with patch.object(self.confluence, "_format_session_update", return_value="<h2>New</h2>"):
+            with patch.object(session, "get", return_value=page), patch.object(
+                session, "put", return_value=MagicMock(status_code=200)
+            ) as mock_put:
+                self.assertTrue(self.confluence._add_session_update("42", {}))
+
+        update = mock_put.call_args.kwargs["json"]
+        self.assertEqual(update["version"], {"number": 4})
+        self.assertEqual(
+            update["body"]["storage"]["value"], "<h1>Log</h1><h2>New</h2><hr/><h2>Old</h2><hr/>"
+        )
+
+    def test_parse_json_without_orjson(self):
+        """Test API responses are parsed with the standard library when orjson is missing"""
+        response = requests.Response()
+        response._content = b'{"results": [{"id": "42"}]}'
+
+        expected = parse_json(response)
+        with patch("contextflow.integrations.http_session.orjson", None):
+            self.assertEqual(parse_json(response), expected)
+        self.assertEqual(expected, {"results": [{"id": "42"}]})
+
+    def test_requests_share_pooled_session(self):
+        """Test API calls reuse one session carrying the credentials"""
+        session = self.confluence._session
+        self.assertIs(session.auth, self.confluence.auth)
+
+        with patch.object(session, "get", return_value=MagicMock(status_code=500)) as mock_get:
+            self.assertEqual(self.confluence.extract_project_context(), {})
+        mock_get.assert_called_once_with(
+            "https://example.atlassian.net/wiki/rest/api/content",
+            params={"spaceKey": "DEV", "type": "page", "limit": 10},
+        )
+
+        self.confluence.close()
+
+
+class TestJiraIntegration(unittest.TestCase):
+    def setUp(self):
+        self.jira = JiraIntegration(
+            {
+                "base_url": "https://example.atlassian.net",
+                "project_key": "PROJ",
+                "username": "user",
+                "api_token": "secret",
+            }
+        )
+
+    def test_issue_work_items(self):
+        """Test JIRA issue keys are recognized"""
+        for work_item in ["PROJ-1", "AB-23"]:
+            self.assertTrue(self.jira._is_jira_issue(work_item))
+        for work_item in ["proj-1", "#2", "PROJ-", "PROJ-1a", "P1-2", "issue-3"]:
+            self.assertFalse(self.jira._is_jira_issue(work_item))
+
+    def test_update_comments_on_each_issue(self):
+        """Test a session update posts one shared comment body to every JIRA issue"""
+        updates = {"work_items": ["PROJ-1", "#2", "OPS-3"], "summary": "Fixed sync"}
+        messages = []
+
+        with patch.object(self.jira, "_add_session_comment") as mock_comment:
+            self.jira.update_from_session(updates, log=messages.append)
+
+        # Progress goes to the given log, including from the comment worker threads
+        self.assertEqual(messages, ["   ✅ JIRA updated for 3 work items"])
+        self.assertEqual(mock_comment.call_args.kwargs["log"], messages.append)
+
+        calls = sorted(call.args for call in mock_comment.call_args_list)
+        self.assertEqual([issue_key for issue_key, _ in calls], ["OPS-3", "PROJ-1"])
+        self.assertIs(calls[0][1], calls[1][1])
+        self.assertIsInstance(calls[0][1], bytes)
+        self.assertIn("Session Summary: Fixed sync", calls[0][1].decode("utf-8"))
+
+    def test_comment_posted_as_json(self):
+        """Test comment bodies are encoded once as JSON for the JSON content type"""
+        comment_data = self.jira._build_comment_data({"summary": "Fixed sync"}, "2024-01-02 03:04")
+
+        with patch.object(
+            self.jira._session, "post", return_value=MagicMock(status_code=201)
+        ) as mock_post:
+            self.jira._add_session_comment("PROJ-1", dump_json(comment_data))
+
+        body = mock_post.call_args.kwargs["data"]
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), comment_data)
+        with patch("contextflow.integrations.http_session.orjson", None):
+            self.assertEqual(json.loads(dump_json(comment_data)), comment_data)
+
+    def test_project_issues(self):
+        """Test search results are paged and flattened into issue summaries"""
+        body = {
+            "issues": [
+                {
+                    "key": "PROJ-1",
+                    "fields": {
+                        "summary": "Crash on start",
+                        "status": {"name": "In Progress"},
+                        "assignee": {"displayName": "Dev"},
+                        "updated": "2025-01-02T03:04:05.000+0000",
+                    },
+                },
+                {
+                    "key": "PROJ-2",
+                    "fields": {
+                        "summary": "Docs",
+                        "status": {"name": "To Do"},
+                        "assignee": None,
+                        "updated": "2025-01-01T03:04:05.000+0000",
+                    },
+                },
+            ]
+        }
+        # The second issue arrives on a separate page
+        pages = [
+            MagicMock(
+                status_code=200,
+                content=json.dumps({"issues": body["issues"][:1], "nextPageToken": "p2"}).encode(),
+            ),
+            MagicMock(
+                status_code=200,
+                content=json.dumps({"issues": body["issues"][1:], "isLast": True}).encode(),
+            ),
+        ]
+
+        with patch.object(self.jira._session, "get", side_effect=pages) as mock_get:
+            issues = self.jira.get_project_issues(2)
+
+        url, second_page = mock_get.call_args.args[0], mock_get.call_args.kwargs["params"]
+        self.assertEqual(url, "https://example.atlassian.net/rest/api/3/search/jql")
+        self.assertEqual((second_page["nextPageToken"], second_page["maxResults"]), ("p2", 1))
+
+        self.assertEqual(
+            issues[0],
+            {
+                "key": "PROJ-1",
+                "summary": "Crash on start",
+                "status": "In Progress",
+                "assignee": "Dev",
+                "updated": "2025-01-02T03:04:05.000+0000",
+            },
+        )
+        self.assertEqual(issues[1]["assignee"], "Unassigned")
+
+    def test_project_lookups_cached(self):
+        """Test project info is fetched once within its TTL and errors are not cached"""
+        found = MagicMock(status_code=200, content=b'{"name": "Project"}')
+        session = self.jira._session
+
+        with patch.object(session, "get", return_value=found) as mock_get:
+            self.assertEqual(self.jira._get_project_info(), {"name": "Project"})
+            self.assertEqual(self.jira._get_project_info(), {"name": "Project"})
+        self.assertEqual(mock_get.call_count, 1)
+
+        expired = time.monotonic() + 301
+        failed = MagicMock(status_code=500)
+        with patch("contextflow.integrations.jira.time.monotonic", return_value=expired):
+            with patch.object(session, "get", return_value=failed) as mock_get:
+                self.assertEqual(self.jira._get_project_info(), {})
+                self.assertEqual(self.jira._get_project_info(), {})
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_requests_share_pooled_session(self):
+        """Test API calls reuse one session carrying the credentials and JSON headers"""
+        session = self.jira._session
+        self.assertIs(session.auth, self.jira.auth)
+        self.assertEqual(session.headers["Accept"], "application/json")
+
+        with patch.object(session, "get", return_value=MagicMock(status_code=404)) as mock_get:
+            self.assertEqual(self.jira._get_project_info(), {})
+        mock_get.assert_called_once_with("https://example.atlassian.net/rest/api/3/project/PROJ")
+
+        self.jira.close()
+
+    def test_requests_time_out(self):
+        """Test requests without an explicit timeout get the default one"""
+        adapter = self.jira._session.get_adapter("https://example.atlassian.net")
+
+        with patch.object(
+            requests.adapters.HTTPAdapter, "send", return_value=MagicMock(status_code=404)
+        ) as mock_send:
+            self.assertEqual(self.jira._get_project_info(), {})
+            adapter.send(MagicMock(), timeout=1)
+
+        self.assertEqual(mock_send.call_args_list[0].kwargs["timeout"], HTTP_TIMEOUT)
+        self.assertEqual(mock_send.call_args_list[1].kwargs["timeout"], 1)
@@ -0,0 +1,116 @@
+import unittest
+import time
+import os
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    from contextflow.core.config import ContextFlowConfig
+    from contextflow.core.context_extractor import ContextExtractor
+    from contextflow.core.session_updater import SessionUpdater
+except ImportError:
+    # Skip tests if dependencies not available
+    pytest.skip("contextflow dependencies not available", allow_module_level=True)
+
+
+class TestSessionUpdater(unittest.TestCase):
+    @pytest.fixture(autouse=True)
+    def _project(self, project_dir):
+        self.temp_dir = str(project_dir)
+        self.config = ContextFlowConfig(os.path.join(self.temp_dir, "contextflow.yaml"))
+        self.updater = SessionUpdater(self.config)
+
+    def test_parse_work_items_and_files(self):
+        """Test work item and file references are extracted once, in first-seen order"""
+        updates = self.updater.parse_session_summary(
+            "Worked on PROJ-123, #45 and Task-7 in src/auth and docs/setup.md\n"
+            "Follow-up for PROJ-123 in src/auth"
+        )
+
+        self.assertEqual(updates["work_items"], ["PROJ-123", "#45", "Task-7"])
+        self.assertEqual(updates["files_changed"], ["src/auth", "docs/setup.md"])
+
+    def test_parse_categories(self):
+        """Test summaries are categorized by keyword"""
+        updates = self.updater.parse_session_summary(
+            "Implemented new feature for login\nFixed token refresh\nUpdated README guide"
+        )
+
+        self.assertEqual(sorted(updates["categories"]), ["bugfix", "documentation", "feature"])
+        self.assertEqual(updates["features_added"], ["Implemented new feature for login"])
+        self.assertEqual(updates["bugs_fixed"], ["Fixed token refresh"])
+        self.assertEqual(updates["documentation_updates"], ["Updated README guide"])
+        self.assertEqual(updates["architecture_changes"], [])
+
+    def test_parse_categories_without_ahocorasick(self):
+        """Test keyword categorization with the regex fallback"""
+        summary = "Refactor auth design\nAdded new endpoint\nFixed docs typo"
+        expected = self.updater.parse_session_summary(summary)
+
+        with patch("contextflow.core.session_updater.SUMMARY_KEYWORD_AUTOMATON", None):
+            updates = self.updater.parse_session_summary(summary)
+
+        for key in ["categories", "features_added", "bugs_fixed", "architecture_changes"]:
+            self.assertEqual(updates[key], expected[key])
+        self.assertEqual(updates["features_added"], ["Added new endpoint"])
+        self.assertEqual(updates["documentation_updates"], ["Fixed docs typo"])
+
+    def test_create_session_log(self):
+        """Test session logs list parsed updates and can be read back by the extractor"""
+        summary = "Fixed login bug PROJ-7 in src/auth.py"
+        updates = self.updater.parse_session_summary(summary)
+        log_file = self.updater.create_session_log(summary, updates)
+
+        timestamp = datetime.fromisoformat(updates["timestamp"])
+        self.assertEqual(log_file.name, timestamp.strftime("session_%Y%m%d_%H%M%S.md"))
+
+        content = log_file.read_text(encoding="utf-8")
+        self.assertTrue(content.startswith("# ContextFlow Session Log\n\n**Project:** "))
+        self.assertIn("**Categories:** bugfix\n**Work Items:** 1\n", content)
+        self.assertIn("### Bugs Fixed\n- Fixed login bug PROJ-7 in src/auth.py\n\n", content)
+
+        extractor = ContextExtractor(self.config)
+        self.assertEqual(extractor._get_recent_work_items(), ["PROJ-7"])
+        self.assertEqual(extractor._get_recent_changes(), [f"Recent: {summary}..."])
+
+    def test_update_integrations(self):
+        """Test every integration receives the update and failures are counted separately"""
+        self.config.ai_context.auto_refresh = False
+        def slow_update(updates, log):
+            # Finish after the failing integration so its output comes first in time
+            time.sleep(0.05)
+            log("   github comment 1")
+            log("   github comment 2")
+
+        def failing_update(updates, log):
+            log("   jira comment")
+            raise RuntimeError("offline")
+
+        working = MagicMock()
+        working.update_from_session.side_effect = slow_update
+        failing = MagicMock()
+        failing.update_from_session.side_effect = failing_update
+        self.updater.integrations = {"github": working, "jira": failing, "legacy": object()}
+
+        with patch("builtins.print") as mock_print:
+            self.assertTrue(self.updater.update_session_documentation("Fixed PROJ-1 in app.py"))
+
+        working.update_from_session.assert_called_once()
+        failing.update_from_session.assert_called_once()
+        printed = [call.args[0] for call in mock_print.call_args_list]
+        # Each integration's messages are printed together, in configuration order
+        start = printed.index("   github comment 1")
+        self.assertEqual(
+            printed[start : start + 5],
+            [
+                "   github comment 1",
+                "   github comment 2",
+                "   Github updated",
+                "   jira comment",
+                "   Jira update failed: offline",
+            ],
+        )
+        self.assertIn("   Legacy doesn't support session updates", printed)
+        self.assertIn("Session documentation updated! (1/3 integrations)", printed)
@@ -1,24 +1,27 @@
 import unittest
-import tempfile
 import os
-import sys
 
-# Add the parent directory to the path to import contextflow
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import pytest
 
 try:
+    from contextflow.core.config import ContextFlowConfig
     from contextflow.templates.project_templates import ProjectTemplates
 except ImportError:
     # Skip tests if dependencies not available
-    import pytest
-
     pytest.skip("contextflow dependencies not available", allow_module_level=True)
 
 
 class TestProjectTemplates(unittest.TestCase):
-    def setUp(self):
-        self.templates = ProjectTemplates()
-        self.temp_dir = tempfile.mkdtemp()
+    @classmethod
+    def setUpClass(cls):
+        cls.templates = ProjectTemplates()
+
+    @pytest.fixture(autouse=True)
+    def _temp_dir(self, tmp_path, monkeypatch):
+        # pytest creates and prunes the directory, so there is no per-test rmtree
+        self.temp_dir = str(tmp_path)
+        # Working directory changes are undone by pytest after each test
+        self.monkeypatch = monkeypatch
 
     def test_get_available_templates(self):
         """Test getting available templates"""
@@ -38,57 +41,47 @@ class TestProjectTemplates(unittest.TestCase):
             self.assertIsInstance(template["description"], str)
             self.assertIsInstance(template["integrations"], list)
 
-    def test_create_software_development_project(self):
-        """Test creating software development project"""
-        old_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
-
-        try:
-            config = self.templates.create_project_from_template(
-                "software-development", "Test Project", "Test Description"
-            )
+    def test_templates_shared(self):
+        """Test template settings are shared but copied into each configuration"""
+        self.assertIs(self.templates.templates, ProjectTemplates().templates)
 
-            self.assertIsNotNone(config)
-            self.assertEqual(config.project.name, "Test Project")
-            self.assertEqual(config.project.description, "Test Description")
-            self.assertEqual(config.project.type, "software-development")
+        config = ContextFlowConfig(os.path.join(self.temp_dir, "contextflow.yaml"))
+        settings = self.templates.templates["software-development"]["config"]
+        self.templates._apply_template(config, "Test", "Test", settings)
 
-            # Check that config file was created
-            self.assertTrue(os.path.exists("contextflow.yaml"))
+        self.assertEqual(config.workflow.session_log_retention_days, 90)
+        self.assertEqual(config.integrations.jira["project_key"], "PROJ")
+        config.project.tags.append("changed")
+        self.assertNotIn("changed", settings["project"]["tags"])
 
-        finally:
-            os.chdir(old_cwd)
-
-    def test_create_side_project(self):
-        """Test creating side project"""
-        old_cwd = os.getcwd()
-        os.chdir(self.temp_dir)
+    def test_create_project(self):
+        """Test creating projects from templates writes the applied configuration"""
+        # (template, name, description, work item references required)
+        cases = [
+            ("software-development", "Test Project", "Test Description", True),
+            # Side projects should have relaxed workflow
+            ("side-project", "My Side Project", "Personal project", False),
+        ]
 
-        try:
-            config = self.templates.create_project_from_template(
-                "side-project", "My Side Project", "Personal project"
-            )
+        for template, name, description, require_work_items in cases:
+            with self.subTest(template=template):
+                # Each project gets its own directory so no config file is reused
+                project_dir = os.path.join(self.temp_dir, template)
+                os.mkdir(project_dir)
+                self.monkeypatch.chdir(project_dir)
 
-            self.assertIsNotNone(config)
-            self.assertEqual(config.project.name, "My Side Project")
-            self.assertEqual(config.project.type, "side-project")
+                config = self.templates.create_project_from_template(template, name, description)
 
-            # Side projects should have relaxed workflow
-            self.assertFalse(config.workflow.require_work_item_references)
+                self.assertIsNotNone(config)
+                self.assertEqual(config.project.name, name)
+                self.assertEqual(config.project.description, description)
+                self.assertEqual(config.project.type, template)
+                self.assertEqual(config.workflow.require_work_item_references, require_work_items)
 
-        finally:
-            os.chdir(old_cwd)
+                # Check that config file was created
+                self.assertTrue(os.path.exists("contextflow.yaml"))
 
     def test_invalid_template(self):
         """Test creating project with invalid template"""
         with self.assertRaises(ValueError):
             self.templates.create_project_from_template("invalid-template", "Test", "Test")
-
-    def tearDown(self):
-        import shutil
-
-        shutil.rmtree(self.temp_dir)
-
-
-if __name__ == "__main__":
-    unittest.main()